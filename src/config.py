@@ -1,10 +1,11 @@
 """Configuration and rubric loading for Automaton Auditor."""
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 
-from src.paths import RUBRIC_DIR, DEFAULT_RUBRIC_PATH
+from src.paths import DEFAULT_RUBRIC_PATH, list_rubric_files
 
 
 def list_available_rubrics() -> List[Path]:
@@ -13,9 +14,7 @@ def list_available_rubrics() -> List[Path]:
     Returns:
         List of Paths to rubric files (sorted by name).
     """
-    if not RUBRIC_DIR.exists():
-        return []
-    return sorted(RUBRIC_DIR.glob("*.json"))
+    return list_rubric_files()
 
 
 def load_rubric(rubric_path: str = None) -> Dict[str, Any]:
@@ -91,11 +90,28 @@ def get_env_var(key: str, default: str = None, required: bool = False) -> str:
     return value
 
 
+# Default cap on in-flight judge LLM calls across all judges (overridden by JUDGE_CONCURRENCY)
+JUDGE_MAX_CONCURRENCY = 16
+
+
+def _judge_concurrency() -> int:
+    """Parse JUDGE_CONCURRENCY; unset, empty or non-numeric values fall back to JUDGE_MAX_CONCURRENCY."""
+    try:
+        limit = int(get_env_var("JUDGE_CONCURRENCY", "").strip() or JUDGE_MAX_CONCURRENCY)
+    except ValueError:
+        limit = JUDGE_MAX_CONCURRENCY
+    return max(1, limit)
+
+
+@lru_cache(maxsize=1)
 def load_env_config() -> Dict[str, str]:
     """Load configuration from environment variables.
 
     Loads .env first, then .env.example if no API key is set (so keys in .env.example work).
     Prefer putting secrets in .env (usually gitignored); .env.example is the template.
+
+    The result is cached for the process (judges call this on every node entry); call
+    load_env_config.cache_clear() after changing the environment. Failures are not cached.
     """
     from dotenv import load_dotenv
 
@@ -124,6 +140,8 @@ def load_env_config() -> Dict[str, str]:
         "use_openrouter": use_openrouter,
         "openrouter_base_url": get_env_var("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
         "model": get_env_var("LLM_MODEL", "gpt-4o"),  # Default model, can be overridden
+        "judge_concurrency": _judge_concurrency(),  # In-flight judge LLM calls (all judges)
+        "judge_cache": get_env_var("JUDGE_CACHE", "false").lower() == "true",  # Reuse opinions for identical prompts
         "langchain_tracing_v2": get_env_var("LANGCHAIN_TRACING_V2", "false").lower() == "true",
         "langchain_api_key": get_env_var("LANGCHAIN_API_KEY", ""),
         "langchain_project": get_env_var("LANGCHAIN_PROJECT", "automaton-auditor"),
@@ -353,7 +353,8 @@ def _repo_has_architecture_diagram(repo_url: str) -> tuple[bool, str]:
     """Check if repo contains an architectural diagram (e.g. docs/architecture.md or README with Mermaid)."""
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = clone_repo(repo_url, tmpdir)
+            # Only the current tree is read, so history is not fetched
+            repo_path = clone_repo(repo_url, tmpdir, depth=1)
             for rel_path in ("docs/architecture.md", "README.md"):
                 full = os.path.join(repo_path, rel_path)
                 if os.path.exists(full):
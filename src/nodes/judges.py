@@ -1,7 +1,8 @@
 """Judicial layer nodes for dialectical evaluation.
 
 STRUCTURED OUTPUT ENFORCEMENT (rubric: structured_output_enforcement):
-- All Judge LLM calls use .with_structured_output(JudicialOpinion) bound to the Pydantic schema.
+- All Judge LLM calls use .with_structured_output(JudicialOpinion, method="json_schema") bound to the
+  Pydantic schema; the chain parses each reply into a validated JudicialOpinion.
 - Output includes score (int 1-5), argument (str), cited_evidence (list of evidence UUIDs).
 - Retry logic (JUDICIAL_OPINION_RETRIES) on Pydantic ValidationError and parse failures.
 - Output is validated against JudicialOpinion before being added to state.
@@ -12,42 +13,106 @@ JUDICIAL NUANCE AND DIALECTICS (rubric: judicial_nuance):
   2. Defense: charitable lens; rewards effort, intent, creative workarounds, Spirit of the Law.
   3. Tech Lead: pragmatic lens; focuses on architectural soundness, maintainability, practical viability.
 - Each persona has a separate system prompt; prompts are intentionally distinct to produce genuine score variance.
+- Within a judge, rubric dimensions are evaluated concurrently (asyncio.gather over chain.ainvoke);
+  in-flight calls across all three judges share one process-wide cap (JUDGE_CONCURRENCY) and the
+  shared rate limiter is acquired once per LLM call.
 """
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from openai import DefaultAsyncHttpxClient
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from pydantic import ValidationError
 
 from src.state import AgentState, JudicialOpinion, Evidence
-from src.config import load_env_config
-from src.utils.context_builder import get_judicial_logic
+from src.config import JUDGE_MAX_CONCURRENCY, load_env_config
+from src.utils.context_builder import build_judicial_logic_map
 from src.utils.rate_limiter import get_rate_limiter
 from src.utils.logger import get_logger
+from src.utils.opinion_cache import OpinionCache, get_opinion_cache
 
 logger = get_logger("judges")
 
 # Retries for structured output parse/validation failures (e.g. invalid JSON from LLM)
 JUDICIAL_OPINION_RETRIES = 3
 
+# Per-request LLM timeout, also the default of each judge run's own async HTTP client
+# (_evaluate_all). Clients are never shared: one event loop per judge node, one client per loop.
+LLM_TIMEOUT_SECONDS = 60
 
-def _escape_braces_for_prompt(text: str) -> str:
-    """Escape { and } so LangChain prompt template doesn't treat them as placeholders."""
-    if not text:
-        return text
-    return str(text).replace("{", "{{").replace("}", "}}")
+# Judge nodes run their event loops in separate graph worker threads, so the cap is a thread semaphore
+_judge_slots: Optional[threading.BoundedSemaphore] = None
+_judge_slots_lock = threading.Lock()
 
 
-def _invoke_judicial_chain(chain, judge_name: str, criterion_id: str) -> Optional[JudicialOpinion]:
-    """Invoke chain with retries on validation/parse errors. Returns None if all retries fail.
+def _get_judge_slots() -> threading.BoundedSemaphore:
+    """Get the process-wide semaphore shared by all judge nodes."""
+    global _judge_slots
+    if _judge_slots is None:
+        with _judge_slots_lock:
+            if _judge_slots is None:
+                limit = load_env_config().get("judge_concurrency", JUDGE_MAX_CONCURRENCY)
+                _judge_slots = threading.BoundedSemaphore(max(1, limit))
+    return _judge_slots
+
+
+# Threads that block in the semaphore on behalf of waiting coroutines. Kept apart from the
+# loop's default executor, which httpx needs for DNS lookups while slot holders run.
+_judge_slot_waiters = ThreadPoolExecutor(max_workers=32, thread_name_prefix="judge-slot")
+
+
+@asynccontextmanager
+async def _judge_slot():
+    """Hold one shared judge slot without blocking the event loop."""
+    slots = _get_judge_slots()
+    if not slots.acquire(blocking=False):
+        waiter = _judge_slot_waiters.submit(slots.acquire)
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            # A waiter thread already blocked in acquire() still gets its slot; hand it straight back
+            waiter.add_done_callback(lambda f: f.cancelled() or slots.release())
+            raise
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def _opinion_cache_key(judge_name: str, llm: ChatOpenAI, system_prompt: str, user_prompt: str) -> Optional[str]:
+    """Content-hash key for the opinion cache, or None when JUDGE_CACHE is disabled."""
+    if not load_env_config().get("judge_cache", False):
+        return None
+    return OpinionCache.make_key(judge_name, llm.model_name, llm.temperature, system_prompt, user_prompt)
+
+
+async def _ainvoke_judicial_chain(
+    chain, messages: List[BaseMessage], judge_name: str, criterion_id: str, cache_key: Optional[str] = None
+) -> Optional[JudicialOpinion]:
+    """Invoke chain on pre-rendered messages with retries on validation/parse errors.
+
+    Returns None if all retries fail.
     Explicitly retries on Pydantic ValidationError (malformed LLM output) and other exceptions.
+    When cache_key is given, a cached opinion short-circuits the call and fresh ones are stored.
     """
+    if cache_key:
+        cached = get_opinion_cache().get(cache_key)
+        if cached:
+            logger.debug(f"{judge_name}: Opinion cache hit for {criterion_id}")
+            return cached
     last_error = None
     for attempt in range(JUDICIAL_OPINION_RETRIES):
         try:
-            opinion = chain.invoke({})
-            if opinion and isinstance(opinion, JudicialOpinion):
-                return opinion
+            await get_rate_limiter().async_wait_if_needed()
+            # json_schema structured output (include_raw=False) returns a JudicialOpinion or raises
+            opinion = await chain.ainvoke(messages)
+            if cache_key:
+                get_opinion_cache().put(cache_key, opinion)
+            return opinion
         except ValidationError as e:
             last_error = e
             logger.warning(
@@ -63,12 +128,35 @@ def _invoke_judicial_chain(chain, judge_name: str, criterion_id: str) -> Optiona
     return None
 
 
-def _create_llm(temperature: float, model: str = None) -> ChatOpenAI:
+def _no_evidence_opinion(judge_name: str, criterion_id: str) -> Dict[str, Any]:
+    """Canned score-1 opinion (as dict) for a criterion with no collected evidence."""
+    return JudicialOpinion(
+        judge=judge_name,
+        criterion_id=criterion_id,
+        score=1,
+        argument="No evidence collected for this criterion; insufficient basis for a higher score.",
+        cited_evidence=[]
+    ).model_dump()
+
+
+def _parse_failed_opinion(judge_name: str, criterion_id: str) -> Dict[str, Any]:
+    """Score-1 fallback opinion (as dict) when the LLM never produced a valid opinion."""
+    return JudicialOpinion(
+        judge=judge_name,
+        criterion_id=criterion_id,
+        score=1,
+        argument="Structured output parse failed after retries. Insufficient evidence to form confident opinion.",
+        cited_evidence=[]
+    ).model_dump()
+
+
+def _create_llm(temperature: float, model: str = None, http_async_client=None) -> ChatOpenAI:
     """Create LLM instance with proper configuration for OpenAI or OpenRouter.
     
     Args:
         temperature: Temperature for the model
         model: Model name (optional, uses config default if not provided)
+        http_async_client: httpx.AsyncClient for async calls, owned by the caller's event loop
         
     Returns:
         Configured ChatOpenAI instance
@@ -84,9 +172,10 @@ def _create_llm(temperature: float, model: str = None) -> ChatOpenAI:
         llm = ChatOpenAI(
             model=model_name,
             temperature=temperature,
-            timeout=60,
+            timeout=LLM_TIMEOUT_SECONDS,
             api_key=api_key,
             base_url=base_url,
+            http_async_client=http_async_client,
             default_headers={
                 "HTTP-Referer": "https://github.com/MamaMoh/TRP1-Challenge-Week-2",  # Optional
                 "X-Title": "Automaton Auditor",  # Optional
@@ -97,50 +186,23 @@ def _create_llm(temperature: float, model: str = None) -> ChatOpenAI:
         llm = ChatOpenAI(
             model=model_name,
             temperature=temperature,
-            timeout=60,
-            api_key=api_key
+            timeout=LLM_TIMEOUT_SECONDS,
+            api_key=api_key,
+            http_async_client=http_async_client,
         )
     
     return llm
 
 
-def prosecutor_node(state: AgentState) -> AgentState:
-    """The Critical Lens: Scrutinize for gaps and flaws.
-    
-    System prompt emphasizes finding security flaws, structural violations, and laziness.
-    """
-    # Apply rate limiting
-    rate_limiter = get_rate_limiter()
-    wait_time = rate_limiter.wait_if_needed()
-    
-    llm = _create_llm(temperature=0.7)
-    opinions = []
-    
-    for dimension in state["rubric_dimensions"]:
-        criterion_id = dimension["id"]
-        judicial_logic = get_judicial_logic(
-            {"dimensions": state["rubric_dimensions"], "synthesis_rules": {}},
-            criterion_id,
-            "prosecutor"
-        )
-        
-        # Get relevant evidence (escape braces so prompt template doesn't interpret them)
-        evidence_list = state["evidences"].get(criterion_id, [])
-        evidence_text = "\n".join([
-            f"- {e.goal}: {e.content or 'N/A'} (Found: {e.found}, Confidence: {e.confidence})"
-            for e in evidence_list
-        ])
-        evidence_text_safe = _escape_braces_for_prompt(evidence_text)
-        judicial_logic_safe = _escape_braces_for_prompt(judicial_logic)
-
-        # Prosecutor system prompt - adversarial, critical, harsh (distinct from Defense/Tech Lead)
-        system_prompt = f"""You are The Prosecutor - The Critical Lens.
+# Persona system prompts are static so every call shares an identical prefix, which lets the
+# provider's automatic prompt cache serve it; per-criterion judicial logic goes in the user message.
+
+# Prosecutor system prompt - adversarial, critical, harsh (distinct from Defense/Tech Lead)
+PROSECUTOR_SYSTEM_PROMPT = """You are The Prosecutor - The Critical Lens.
 
 Core Philosophy: "Trust No One. Assume Vibe Coding."
 Objective: Adversarial scrutiny. Scrutinize the evidence for gaps, security flaws, structural violations, and laziness.
-
-Judicial Logic for this criterion:
-{judicial_logic_safe}
+Apply the Judicial Logic given with each criterion.
 
 You must return a structured JudicialOpinion with:
 - score: 1-5 (be harsh, look for violations - default to lower scores)
@@ -149,76 +211,12 @@ You must return a structured JudicialOpinion with:
 
 If evidence is insufficient or missing, score 1 and explain the evidence insufficiency."""
 
-        user_prompt = f"""Criterion: {_escape_braces_for_prompt(dimension['name'])} ({criterion_id})
-
-Evidence:
-{evidence_text_safe if evidence_text_safe else "No evidence collected for this criterion."}
-
-Render your verdict. Be critical. Hunt for flaws."""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("user", user_prompt)
-        ])
-        
-        chain = prompt | llm.with_structured_output(JudicialOpinion)
-        opinion = _invoke_judicial_chain(chain, "Prosecutor", criterion_id)
-        if opinion:
-            opinion.judge = "Prosecutor"
-            opinion.criterion_id = criterion_id
-            if len(opinion.argument) < 50:
-                opinion.argument += " (Insufficient evidence or implementation flaws detected.)"
-            opinions.append(opinion.model_dump())
-            logger.debug(f"Prosecutor: Opinion for {criterion_id} - Score: {opinion.score}")
-        else:
-            opinions.append(JudicialOpinion(
-                judge="Prosecutor",
-                criterion_id=criterion_id,
-                score=1,
-                argument="Structured output parse failed after retries. Insufficient evidence to form confident opinion.",
-                cited_evidence=[]
-            ).model_dump())
-    logger.info(f"Prosecutor: Generated {len(opinions)} opinions")
-    return {"opinions": opinions}
-
-
-def defense_node(state: AgentState) -> AgentState:
-    """The Optimistic Lens: Reward effort and intent.
-    
-    System prompt emphasizes finding creative solutions, deep thinking, and effort.
-    """
-    # Apply rate limiting
-    rate_limiter = get_rate_limiter()
-    wait_time = rate_limiter.wait_if_needed()
-    
-    llm = _create_llm(temperature=0.7)
-    opinions = []
-    
-    for dimension in state["rubric_dimensions"]:
-        criterion_id = dimension["id"]
-        judicial_logic = get_judicial_logic(
-            {"dimensions": state["rubric_dimensions"], "synthesis_rules": {}},
-            criterion_id,
-            "defense"
-        )
-        
-        # Get relevant evidence (escape braces for prompt template)
-        evidence_list = state["evidences"].get(criterion_id, [])
-        evidence_text = "\n".join([
-            f"- {e.goal}: {e.content or 'N/A'} (Found: {e.found}, Confidence: {e.confidence})"
-            for e in evidence_list
-        ])
-        evidence_text_safe = _escape_braces_for_prompt(evidence_text)
-        judicial_logic_safe = _escape_braces_for_prompt(judicial_logic)
-
-        # Defense system prompt - charitable, forgiving (distinct from Prosecutor/Tech Lead)
-        system_prompt = f"""You are The Defense Attorney - The Optimistic Lens.
+# Defense system prompt - charitable, forgiving (distinct from Prosecutor/Tech Lead)
+DEFENSE_SYSTEM_PROMPT = """You are The Defense Attorney - The Optimistic Lens.
 
 Core Philosophy: "Reward Effort and Intent. Look for the 'Spirit of the Law'."
 Objective: Charitable interpretation. Highlight creative workarounds, deep thinking, effort, and iteration history.
-
-Judicial Logic for this criterion:
-{judicial_logic_safe}
+Apply the Judicial Logic given with each criterion.
 
 You must return a structured JudicialOpinion with:
 - score: 1-5 (be generous, look for merit - default to higher scores when effort is visible)
@@ -227,74 +225,12 @@ You must return a structured JudicialOpinion with:
 
 If evidence is insufficient, score 1 but explain what positive aspects might exist."""
 
-        user_prompt = f"""Criterion: {_escape_braces_for_prompt(dimension['name'])} ({criterion_id})
-
-Evidence:
-{evidence_text_safe if evidence_text_safe else "No evidence collected for this criterion."}
-
-Render your verdict. Be charitable. Look for effort and intent."""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("user", user_prompt)
-        ])
-        
-        chain = prompt | llm.with_structured_output(JudicialOpinion)
-        opinion = _invoke_judicial_chain(chain, "Defense", criterion_id)
-        if opinion:
-            opinion.judge = "Defense"
-            opinion.criterion_id = criterion_id
-            if len(opinion.argument) < 50:
-                opinion.argument += " (Evidence suggests effort and intent, though implementation may be incomplete.)"
-            opinions.append(opinion.model_dump())
-        else:
-            opinions.append(JudicialOpinion(
-                judge="Defense",
-                criterion_id=criterion_id,
-                score=1,
-                argument="Structured output parse failed after retries. Insufficient evidence to form confident opinion.",
-                cited_evidence=[]
-            ).model_dump())
-    return {"opinions": opinions}
-
-
-def tech_lead_node(state: AgentState) -> AgentState:
-    """The Pragmatic Lens: Does it work? Is it maintainable?
-    
-    System prompt emphasizes technical soundness, maintainability, and practical viability.
-    """
-    # Apply rate limiting
-    rate_limiter = get_rate_limiter()
-    wait_time = rate_limiter.wait_if_needed()
-    
-    llm = _create_llm(temperature=0.3)
-    opinions = []
-    
-    for dimension in state["rubric_dimensions"]:
-        criterion_id = dimension["id"]
-        judicial_logic = get_judicial_logic(
-            {"dimensions": state["rubric_dimensions"], "synthesis_rules": {}},
-            criterion_id,
-            "tech_lead"
-        )
-        
-        # Get relevant evidence (escape braces for prompt template)
-        evidence_list = state["evidences"].get(criterion_id, [])
-        evidence_text = "\n".join([
-            f"- {e.goal}: {e.content or 'N/A'} (Found: {e.found}, Confidence: {e.confidence})"
-            for e in evidence_list
-        ])
-        evidence_text_safe = _escape_braces_for_prompt(evidence_text)
-        judicial_logic_safe = _escape_braces_for_prompt(judicial_logic)
-
-        # Tech Lead system prompt - pragmatic, balanced (distinct from Prosecutor/Defense)
-        system_prompt = f"""You are The Tech Lead - The Pragmatic Lens.
+# Tech Lead system prompt - pragmatic, balanced (distinct from Prosecutor/Defense)
+TECH_LEAD_SYSTEM_PROMPT = """You are The Tech Lead - The Pragmatic Lens.
 
 Core Philosophy: "Does it actually work? Is it maintainable?"
 Objective: Pragmatic assessment. Evaluate architectural soundness, code cleanliness, technical debt, and practical viability.
-
-Judicial Logic for this criterion:
-{judicial_logic_safe}
+Apply the Judicial Logic given with each criterion.
 
 You must return a structured JudicialOpinion with:
 - score: 1, 3, or 5 (realistic assessment - 1=fails, 3=works but has issues, 5=excellent)
@@ -303,32 +239,178 @@ You must return a structured JudicialOpinion with:
 
 If evidence is insufficient, score 1 and explain what technical assessment cannot be made."""
 
-        user_prompt = f"""Criterion: {_escape_braces_for_prompt(dimension['name'])} ({criterion_id})
+
+def _criterion_user_prompt(dimension: Dict[str, Any], judicial_logic: str, evidence_text: str, instruction: str) -> str:
+    """Build the per-criterion user message (dynamic content last, after the static system prompt)."""
+    return f"""Criterion: {dimension['name']} ({dimension['id']})
+
+Judicial Logic for this criterion:
+{judicial_logic}
 
 Evidence:
-{evidence_text_safe if evidence_text_safe else "No evidence collected for this criterion."}
+{evidence_text if evidence_text else "No evidence collected for this criterion."}
+
+{instruction}"""
+
+
+def _prosecutor_prompts(dimension: Dict[str, Any], judicial_logic: str, evidence_text: str) -> Tuple[str, str]:
+    """Build (system, user) prompts for the Prosecutor persona."""
+    return PROSECUTOR_SYSTEM_PROMPT, _criterion_user_prompt(
+        dimension, judicial_logic, evidence_text, "Render your verdict. Be critical. Hunt for flaws."
+    )
+
+
+def _defense_prompts(dimension: Dict[str, Any], judicial_logic: str, evidence_text: str) -> Tuple[str, str]:
+    """Build (system, user) prompts for the Defense persona."""
+    return DEFENSE_SYSTEM_PROMPT, _criterion_user_prompt(
+        dimension, judicial_logic, evidence_text, "Render your verdict. Be charitable. Look for effort and intent."
+    )
+
+
+def _tech_lead_prompts(dimension: Dict[str, Any], judicial_logic: str, evidence_text: str) -> Tuple[str, str]:
+    """Build (system, user) prompts for the Tech Lead persona."""
+    return TECH_LEAD_SYSTEM_PROMPT, _criterion_user_prompt(
+        dimension, judicial_logic, evidence_text, "Render your verdict. Be pragmatic. Focus on technical merit."
+    )
+
+
+def _format_evidence_text(evidence_list: List[Evidence]) -> str:
+    """Render a criterion's evidence as prompt bullet lines (sent verbatim; no template escaping needed)."""
+    return "\n".join(
+        f"- {e.goal}: {e.content or 'N/A'} (Found: {e.found}, Confidence: {e.confidence})"
+        for e in evidence_list
+    )
+
+
+async def _evaluate_single(
+    dimension: Dict[str, Any],
+    evidence_text: str,
+    llm: ChatOpenAI,
+    chain,
+    judge_name: str,
+    judicial_logic: str,
+    build_prompts: Callable[[Dict[str, Any], str, str], Tuple[str, str]],
+    short_argument_note: str,
+) -> Dict[str, Any]:
+    """Render one judge's opinion (as dict) for a single rubric dimension."""
+    criterion_id = dimension["id"]
+    if not evidence_text:
+        # No evidence: the persona would score 1 anyway, so skip the LLM round-trip
+        return _no_evidence_opinion(judge_name, criterion_id)
+
+    system_prompt, user_prompt = build_prompts(dimension, judicial_logic, evidence_text)
+
+    messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+    cache_key = _opinion_cache_key(judge_name, llm, system_prompt, user_prompt)
+    async with _judge_slot():
+        opinion = await _ainvoke_judicial_chain(chain, messages, judge_name, criterion_id, cache_key)
+    if not opinion:
+        return _parse_failed_opinion(judge_name, criterion_id)
+    opinion.judge = judge_name
+    opinion.criterion_id = criterion_id
+    if len(opinion.argument) < 50:
+        opinion.argument += short_argument_note
+    logger.debug(f"{judge_name}: Opinion for {criterion_id} - Score: {opinion.score}")
+    return opinion.model_dump()
+
+
+async def _evaluate_all(
+    state: AgentState,
+    temperature: float,
+    judge_name: str,
+    persona: str,
+    build_prompts: Callable[[Dict[str, Any], str, str], Tuple[str, str]],
+    short_argument_note: str,
+) -> List[Dict[str, Any]]:
+    """Evaluate every rubric dimension concurrently; failed dimensions fall back to score 1.
+
+    The LLM's async HTTP client is opened and closed on this coroutine's event loop: each
+    judge node runs its own loop, and an httpx.AsyncClient must not outlive or cross loops.
+    """
+    dimensions = state["rubric_dimensions"]
+    # Format each criterion's evidence once up front; the per-dimension coroutines only look it up
+    evidences = state["evidences"]
+    evidence_texts = {
+        dimension["id"]: _format_evidence_text(evidences.get(dimension["id"]) or [])
+        for dimension in dimensions
+    }
+    if not any(evidence_texts.values()):
+        # Nothing to judge: no LLM client (or API key) is needed for canned score-1 opinions
+        return [_no_evidence_opinion(judge_name, dimension["id"]) for dimension in dimensions]
+    # Resolve every criterion's judicial logic in one pass instead of a rubric scan per dimension
+    logic_map = build_judicial_logic_map(dimensions, persona)
+    async with DefaultAsyncHttpxClient(timeout=LLM_TIMEOUT_SECONDS) as http_client:
+        llm = _create_llm(temperature=temperature, http_async_client=http_client)
+        # Structured-output wrapper is stateless per call: build it once and share across dimensions
+        chain = llm.with_structured_output(JudicialOpinion, method="json_schema")
+        results = await asyncio.gather(
+            *[
+                _evaluate_single(
+                    dimension, evidence_texts[dimension["id"]], llm, chain, judge_name, logic_map[dimension["id"]],
+                    build_prompts, short_argument_note,
+                )
+                for dimension in dimensions
+            ],
+            return_exceptions=True,
+        )
+    opinions = []
+    for dimension, result in zip(dimensions, results):
+        if isinstance(result, Exception):
+            logger.error(f"{judge_name}: Evaluation failed for {dimension['id']}: {result}")
+            result = _parse_failed_opinion(judge_name, dimension["id"])
+        opinions.append(result)
+    return opinions
+
+
+def _run_judge(
+    state: AgentState,
+    temperature: float,
+    judge_name: str,
+    persona: str,
+    build_prompts: Callable[[Dict[str, Any], str, str], Tuple[str, str]],
+    short_argument_note: str,
+) -> List[Dict[str, Any]]:
+    """Run a judge's per-dimension LLM calls concurrently from a synchronous graph node.
+
+    Judge nodes stay synchronous (the graph is driven with graph.invoke); LangGraph runs
+    parallel branches in worker threads, so each judge gets its own event loop (and its own
+    HTTP client, see _evaluate_all) here.
+    """
+    return asyncio.run(_evaluate_all(state, temperature, judge_name, persona, build_prompts, short_argument_note))
 
-Render your verdict. Be pragmatic. Focus on technical merit."""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("user", user_prompt)
-        ])
-        
-        chain = prompt | llm.with_structured_output(JudicialOpinion)
-        opinion = _invoke_judicial_chain(chain, "TechLead", criterion_id)
-        if opinion:
-            opinion.judge = "TechLead"
-            opinion.criterion_id = criterion_id
-            if len(opinion.argument) < 50:
-                opinion.argument += " (Technical assessment limited by insufficient evidence.)"
-            opinions.append(opinion.model_dump())
-        else:
-            opinions.append(JudicialOpinion(
-                judge="TechLead",
-                criterion_id=criterion_id,
-                score=1,
-                argument="Structured output parse failed after retries. Insufficient evidence to form confident opinion.",
-                cited_evidence=[]
-            ).model_dump())
+
+def prosecutor_node(state: AgentState) -> AgentState:
+    """The Critical Lens: Scrutinize for gaps and flaws.
+    
+    System prompt emphasizes finding security flaws, structural violations, and laziness.
+    """
+    opinions = _run_judge(
+        state, 0.7, "Prosecutor", "prosecutor", _prosecutor_prompts,
+        " (Insufficient evidence or implementation flaws detected.)",
+    )
+    logger.info(f"Prosecutor: Generated {len(opinions)} opinions")
+    return {"opinions": opinions}
+
+
+def defense_node(state: AgentState) -> AgentState:
+    """The Optimistic Lens: Reward effort and intent.
+    
+    System prompt emphasizes finding creative solutions, deep thinking, and effort.
+    """
+    opinions = _run_judge(
+        state, 0.7, "Defense", "defense", _defense_prompts,
+        " (Evidence suggests effort and intent, though implementation may be incomplete.)",
+    )
+    return {"opinions": opinions}
+
+
+def tech_lead_node(state: AgentState) -> AgentState:
+    """The Pragmatic Lens: Does it work? Is it maintainable?
+    
+    System prompt emphasizes technical soundness, maintainability, and practical viability.
+    """
+    opinions = _run_judge(
+        state, 0.3, "TechLead", "tech_lead", _tech_lead_prompts,
+        " (Technical assessment limited by insufficient evidence.)",
+    )
     return {"opinions": opinions}
@@ -14,9 +14,11 @@ Conflict resolution uses hardcoded deterministic Python logic (no LLM). Rules ap
 
 Output is a structured AuditReport (Pydantic), not console print.
 """
-from typing import Dict, Any, List, Optional, Tuple, Callable
+import re
+from collections import defaultdict
+from statistics import fmean
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 
-from src.config import load_rubric
 from src.state import AgentState, JudicialOpinion, CriterionResult, AuditReport
 from src.utils.logger import get_logger
 
@@ -25,6 +27,13 @@ logger = get_logger("justice")
 # Expected number of judge personas (Prosecutor, Defense, TechLead)
 NUM_JUDGES = 3
 
+# Explicit security-finding language in a Prosecutor argument (one case-insensitive pass, no .lower() copy)
+_SECURITY_FINDING_RE = re.compile(
+    r"shell injection|command injection|security vulnerability|security flaw", re.IGNORECASE
+)
+_OS_SYSTEM_RE = re.compile(r"os\.system", re.IGNORECASE)
+_OS_SYSTEM_CONFIRMED_RE = re.compile(r"detected|found|used|present|violation|call", re.IGNORECASE)
+
 
 def _security_override_condition(
     prosecutor: JudicialOpinion,
@@ -38,17 +47,11 @@ def _security_override_condition(
     """
     if not prosecutor or not prosecutor.argument:
         return False
-    arg = prosecutor.argument.lower()
+    arg = prosecutor.argument
     # Explicit security findings only
-    if "shell injection" in arg or "command injection" in arg:
-        return True
-    if "security vulnerability" in arg or "security flaw" in arg:
-        return True
-    if "os.system" in arg and any(
-        w in arg for w in ("detected", "found", "used", "present", "violation", "call")
-    ):
+    if _SECURITY_FINDING_RE.search(arg):
         return True
-    return False
+    return bool(_OS_SYSTEM_RE.search(arg) and _OS_SYSTEM_CONFIRMED_RE.search(arg))
 
 
 def _apply_security_override(
@@ -58,7 +61,7 @@ def _apply_security_override(
     _criterion_id: str,
 ) -> Tuple[int, str]:
     """Rule 1: Confirmed security flaw caps score at 3."""
-    score = min(3, tech_lead.score if tech_lead else 3)
+    score = min(3, tech_lead.score)
     return score, "Security flaw detected - score capped at 3 per security_override rule."
 
 
@@ -66,21 +69,18 @@ def _apply_variance_re_evaluation(
     prosecutor: JudicialOpinion,
     defense: JudicialOpinion,
     tech_lead: JudicialOpinion,
-    _criterion_id: str,
+    score_variance: int,
 ) -> Tuple[int, str]:
     """Rule 2: Variance > 2 — Tech Lead tie-breaker; evidence count is secondary."""
-    scores = [p.score for p in (prosecutor, defense, tech_lead) if p]
-    score_variance = max(scores) - min(scores) if scores else 0
     # Prefer Tech Lead as tie-breaker (functionality weight); evidence count only if TL tied
-    tl_score = tech_lead.score if tech_lead else (sum(scores) // len(scores) if scores else 1)
-    p_ev = len(prosecutor.cited_evidence) if prosecutor else 0
-    d_ev = len(defense.cited_evidence) if defense else 0
-    tl_ev = len(tech_lead.cited_evidence) if tech_lead else 0
+    p_ev = len(prosecutor.cited_evidence)
+    d_ev = len(defense.cited_evidence)
+    tl_ev = len(tech_lead.cited_evidence)
     if p_ev > d_ev and p_ev > tl_ev:
         return prosecutor.score, (
             f"High variance ({score_variance} points) - Prosecutor cited more evidence, fact supremacy applied."
         )
-    return tl_score, (
+    return tech_lead.score, (
         f"High variance ({score_variance} points) - Tech Lead assessment used as tie-breaker."
     )
 
@@ -92,20 +92,28 @@ def _apply_functionality_weight(
     criterion_id: str,
 ) -> Tuple[int, str]:
     """Rule 3: Architecture/orchestration criteria — Tech Lead carries highest weight."""
-    s = tech_lead.score if tech_lead else 3
-    return s, "Architecture criterion - Tech Lead assessment carries highest weight per functionality_weight rule."
+    return tech_lead.score, "Architecture criterion - Tech Lead assessment carries highest weight per functionality_weight rule."
 
 
-def _apply_default(
-    _p: JudicialOpinion,
-    _d: JudicialOpinion,
-    tech_lead: JudicialOpinion,
-    _criterion_id: str,
-) -> Tuple[int, str]:
+def _apply_default(tech_lead: JudicialOpinion) -> Tuple[int, str]:
     """Rule 4: Default — Tech Lead breaks ties."""
-    scores = [p.score for p in (_p, _d, tech_lead) if p]
-    s = tech_lead.score if tech_lead else (sum(scores) // len(scores) if scores else 3)
-    return s, "Scores consistent - Tech Lead assessment confirmed."
+    return tech_lead.score, "Scores consistent - Tech Lead assessment confirmed."
+
+
+def _is_architecture_criterion(criterion_id: str) -> bool:
+    """True for architecture/orchestration criteria (functionality_weight applies)."""
+    criterion_lower = criterion_id.lower()
+    return "architecture" in criterion_lower or "orchestration" in criterion_lower
+
+
+def _score_spread(prosecutor: JudicialOpinion, defense: JudicialOpinion, tech_lead: JudicialOpinion) -> int:
+    """Three-judge score variance (max - min), from three scalars without building a list."""
+    p_s, d_s, t_s = prosecutor.score, defense.score, tech_lead.score
+    lo = p_s if p_s < d_s else d_s
+    lo = lo if lo < t_s else t_s
+    hi = p_s if p_s > d_s else d_s
+    hi = hi if hi > t_s else t_s
+    return hi - lo
 
 
 def _resolve_final_score(
@@ -113,120 +121,111 @@ def _resolve_final_score(
     defense: JudicialOpinion,
     tech_lead: JudicialOpinion,
     criterion_id: str,
+    architecture_ids: Optional[FrozenSet[str]] = None,
+    score_variance: Optional[int] = None,
 ) -> Tuple[int, str]:
-    """Apply declarative rules in order; first match wins."""
-    rules: List[Tuple[Callable[..., bool], Callable[..., Tuple[int, str]]]] = [
-        (_security_override_condition, lambda p, d, t, c: _apply_security_override(p, d, t, c)),
-        (
-            lambda p, d, t, c: (max([p.score, d.score, t.score]) - min([p.score, d.score, t.score]) > 2)
-            if all([p, d, t]) else False,
-            _apply_variance_re_evaluation,
-        ),
-        (
-            lambda p, d, t, c: "architecture" in c.lower() or "orchestration" in c.lower(),
-            lambda p, d, t, c: _apply_functionality_weight(p, d, t, c),
-        ),
-    ]
-    for condition, apply_fn in rules:
-        if condition(prosecutor, defense, tech_lead, criterion_id):
-            return apply_fn(prosecutor, defense, tech_lead, criterion_id)
+    """Apply conflict-resolution rules in order; first match wins.
+
+    All three opinions must be present (chief_justice_node scores incomplete criteria 1
+    before getting here). architecture_ids: criterion IDs classified once per rubric by the caller; when
+    omitted the criterion ID is classified here. score_variance: the caller's _score_spread, computed
+    here when omitted.
+    """
+    # Rule 1: Security override
+    if _security_override_condition(prosecutor, defense, tech_lead, criterion_id):
+        return _apply_security_override(prosecutor, defense, tech_lead, criterion_id)
+    # Rule 2: Variance re-evaluation
+    if score_variance is None:
+        score_variance = _score_spread(prosecutor, defense, tech_lead)
+    if score_variance > 2:
+        return _apply_variance_re_evaluation(prosecutor, defense, tech_lead, score_variance)
+    # Rule 3: Functionality weight for architecture/orchestration criteria
+    is_architecture = (
+        criterion_id in architecture_ids if architecture_ids is not None
+        else _is_architecture_criterion(criterion_id)
+    )
+    if is_architecture:
+        return _apply_functionality_weight(prosecutor, defense, tech_lead, criterion_id)
     # Rule 4: Default — Tech Lead breaks ties
-    return _apply_default(prosecutor, defense, tech_lead, criterion_id)
+    return _apply_default(tech_lead)
 
 
 def chief_justice_node(state: AgentState) -> AgentState:
-    """Synthesize dialectical conflict into final verdict using a declarative rule engine.
+    """Synthesize dialectical conflict into final verdict using deterministic ordered rules.
 
     Rules (security override, variance re-evaluation, functionality weight, default) are
     applied in order; first match wins. Runs only when all three judges have submitted
     opinions (one per dimension each).
     """
     opinions_raw = state.get("opinions") or []
-    # Normalize: state stores dicts (from model_dump) to avoid Pydantic serialization warnings
-    opinions: List[JudicialOpinion] = [
-        JudicialOpinion(**o) if isinstance(o, dict) else o
-        for o in opinions_raw
-    ]
     dimensions = state.get("rubric_dimensions") or []
     expected_opinions = len(dimensions) * NUM_JUDGES
 
-    if len(opinions) < expected_opinions:
+    # Check the count before normalizing so an early (partial) invocation does no model work
+    if len(opinions_raw) < expected_opinions:
+        # Lazy %-formatting: this path runs on every partial update, so skip building the message when INFO is off
         logger.info(
-            f"ChiefJustice: Waiting for all judges (have {len(opinions)}/{expected_opinions} opinions), skipping synthesis"
+            "ChiefJustice: Waiting for all judges (have %d/%d opinions), skipping synthesis",
+            len(opinions_raw), expected_opinions,
         )
         return {}
 
-    logger.info(f"ChiefJustice: Synthesizing verdict from {len(opinions)} opinions")
-
-    synthesis_rules = state.get("synthesis_rules")
-    if not synthesis_rules:
-        try:
-            rubric_path = state.get("rubric_path")
-            rubric = load_rubric(rubric_path) if rubric_path else load_rubric()
-            synthesis_rules = rubric.get("synthesis_rules", {})
-        except Exception:
-            pass
-    if not synthesis_rules:
-        synthesis_rules = {
-            "security_override": "Confirmed security flaws cap total score at 3.",
-            "fact_supremacy": "Forensic evidence (facts) always overrules Judicial opinion (interpretation).",
-            "functionality_weight": "Tech Lead assessment carries highest weight for architecture criteria.",
-            "dissent_requirement": "The Chief Justice must summarize why the Prosecutor and Defense disagreed.",
-            "variance_re_evaluation": "If score variance > 2, re-evaluate specific evidence cited by each judge."
-        }
-    
-    # Group opinions by criterion
-    opinions_by_criterion: Dict[str, List[JudicialOpinion]] = {}
+    # Normalize: state stores dicts (from model_dump) to avoid Pydantic serialization warnings.
+    # Judges validate every opinion before dumping it, so rebuild without re-validating.
+    opinions: List[JudicialOpinion] = [
+        JudicialOpinion.model_construct(**o) if isinstance(o, dict) else o
+        for o in opinions_raw
+    ]
+
+    logger.info("ChiefJustice: Synthesizing verdict from %d opinions", len(opinions))
+
+    # Group opinions by criterion, then judge (single pass; first opinion per judge wins)
+    opinions_by_criterion: Dict[str, Dict[str, JudicialOpinion]] = defaultdict(dict)
     for opinion in opinions:
-        if opinion.criterion_id not in opinions_by_criterion:
-            opinions_by_criterion[opinion.criterion_id] = []
-        opinions_by_criterion[opinion.criterion_id].append(opinion)
+        opinions_by_criterion[opinion.criterion_id].setdefault(opinion.judge, opinion)
     
     criteria_results: List[CriterionResult] = []
-    total_score = 0.0
-    criterion_count = 0
     
-    for dimension in state["rubric_dimensions"]:
+    # Rubric dimensions are static for the run: classify functionality-weighted criteria once
+    architecture_ids = frozenset(d["id"] for d in dimensions if _is_architecture_criterion(d["id"]))
+    for dimension in dimensions:
         criterion_id = dimension["id"]
         criterion_name = dimension["name"]
         
-        opinions = opinions_by_criterion.get(criterion_id, [])
-        prosecutor = next((o for o in opinions if o.judge == "Prosecutor"), None)
-        defense = next((o for o in opinions if o.judge == "Defense"), None)
-        tech_lead = next((o for o in opinions if o.judge == "TechLead"), None)
+        by_judge = opinions_by_criterion.get(criterion_id, {})
+        prosecutor = by_judge.get("Prosecutor")
+        defense = by_judge.get("Defense")
+        tech_lead = by_judge.get("TechLead")
         
         if not all([prosecutor, defense, tech_lead]):
             # Missing opinions - use lowest score (deterministic, no LLM)
             final_score = 1
-            criteria_results.append(CriterionResult(
+            criteria_results.append(CriterionResult.model_construct(
                 dimension_id=criterion_id,
                 dimension_name=criterion_name,
                 final_score=final_score,
-                judge_opinions=opinions,
+                judge_opinions=list(by_judge.values()),
                 dissent_summary="Missing judge opinions - incomplete evaluation.",
                 remediation="Ensure all three judges (Prosecutor, Defense, Tech Lead) provide opinions for this criterion."
             ))
-            total_score += final_score
-            criterion_count += 1
             continue
 
         # Conflict resolution logic
         # Rule of Security, Rule of Evidence (fact supremacy), Rule of Functionality, variance re-evaluation (deterministic, no LLM)
-        final_score, rationale = _resolve_final_score(prosecutor, defense, tech_lead, criterion_id)
-        scores = [prosecutor.score, defense.score, tech_lead.score]
-        score_variance = max(scores) - min(scores)
+        score_variance = _score_spread(prosecutor, defense, tech_lead)
+        final_score, rationale = _resolve_final_score(
+            prosecutor, defense, tech_lead, criterion_id, architecture_ids, score_variance
+        )
         
-        # Generate dissent summary if variance > 2 (concatenation avoids brace-format errors)
+        # Generate dissent summary if variance > 2 (f-string interpolation is safe for braces in arguments)
         dissent_summary: Optional[str] = None
-        if prosecutor and defense and abs(prosecutor.score - defense.score) > 2:
-            p_arg = (prosecutor.argument[:150] + "...") if len(prosecutor.argument) > 150 else prosecutor.argument
-            d_arg = (defense.argument[:150] + "...") if len(defense.argument) > 150 else defense.argument
+        if abs(prosecutor.score - defense.score) > 2:
+            p_full, d_full = prosecutor.argument, defense.argument
+            p_arg = p_full[:150] + ("..." if len(p_full) > 150 else "")
+            d_arg = d_full[:150] + ("..." if len(d_full) > 150 else "")
             dissent_summary = (
-                "Prosecutor (" + str(prosecutor.score) + "/5) vs Defense (" + str(defense.score) + "/5) - "
-                + str(score_variance) + " point variance. "
-                "Prosecutor: " + str(p_arg) + " "
-                "Defense: " + str(d_arg) + " "
-                "Resolution: " + str(rationale)
+                f"Prosecutor ({prosecutor.score}/5) vs Defense ({defense.score}/5) - {score_variance} point variance. "
+                f"Prosecutor: {p_arg} Defense: {d_arg} Resolution: {rationale}"
             )
         
         # Generate remediation from Tech Lead opinion
@@ -234,7 +233,7 @@ def chief_justice_node(state: AgentState) -> AgentState:
         if final_score < 3:
             remediation += f"\n\nPriority: Address issues identified by Tech Lead. Focus on: {criterion_name}"
         
-        criteria_results.append(CriterionResult(
+        criteria_results.append(CriterionResult.model_construct(
             dimension_id=criterion_id,
             dimension_name=criterion_name,
             final_score=final_score,
@@ -242,43 +241,47 @@ def chief_justice_node(state: AgentState) -> AgentState:
             dissent_summary=dissent_summary,
             remediation=remediation
         ))
-        
-        total_score += final_score
-        criterion_count += 1
     
     # Calculate overall score
-    overall_score = total_score / criterion_count if criterion_count > 0 else 0.0
+    criterion_count = len(criteria_results)
+    overall_score = fmean(cr.final_score for cr in criteria_results) if criteria_results else 0.0
     
     # Use original PDF URL/path in report (pdf_display), not the resolved download path
     pdf_for_report = state.get("pdf_display") or state.get("pdf_path") or ""
-    executive_summary = (
-        "**Automaton Auditor Report**\n\n"
-        "**Target Repository:** " + str(state.get("repo_url", "")) + "\n"
-        "**PDF Report:** " + str(pdf_for_report) + "\n\n"
-        "**Overall Score:** " + f"{overall_score:.2f}" + "/5.0\n\n"
-        "**Summary:** Evaluated " + str(criterion_count) + " criteria across forensic accuracy, judicial nuance, "
-        "graph orchestration, and documentation quality. "
-    )
+    summary_parts = [
+        "**Automaton Auditor Report**\n\n",
+        f"**Target Repository:** {state.get('repo_url', '')}\n",
+        f"**PDF Report:** {pdf_for_report}\n\n",
+        f"**Overall Score:** {overall_score:.2f}/5.0\n\n",
+        f"**Summary:** Evaluated {criterion_count} criteria across forensic accuracy, judicial nuance, "
+        "graph orchestration, and documentation quality. ",
+    ]
 
-    low_scores = [cr for cr in criteria_results if cr.final_score < 3]
+    # Single pass: low-scoring criteria (reused by the remediation plan) and the high-score count
+    low_scores: List[CriterionResult] = []
+    high_count = 0
+    for cr in criteria_results:
+        if cr.final_score < 3:
+            low_scores.append(cr)
+        elif cr.final_score >= 4:
+            high_count += 1
     if low_scores:
-        executive_summary += str(len(low_scores)) + " criteria scored below 3/5, indicating areas requiring remediation. "
-
-    high_scores = [cr for cr in criteria_results if cr.final_score >= 4]
-    if high_scores:
-        executive_summary += str(len(high_scores)) + " criteria scored 4/5 or higher, indicating strong implementation. "
+        summary_parts.append(f"{len(low_scores)} criteria scored below 3/5, indicating areas requiring remediation. ")
+    if high_count:
+        summary_parts.append(f"{high_count} criteria scored 4/5 or higher, indicating strong implementation. ")
+    executive_summary = "".join(summary_parts)
 
     # Generate consolidated remediation plan (serializer adds the section heading)
-    remediation_plan = ""
-    for cr in criteria_results:
-        if cr.final_score < 3:
-            remediation_plan += "### " + str(cr.dimension_name) + " (Score: " + str(cr.final_score) + "/5)\n\n"
-            remediation_plan += str(cr.remediation) + "\n\n"
-    
-    if not any(cr.final_score < 3 for cr in criteria_results):
-        remediation_plan += "No critical remediation required. All criteria scored 3/5 or higher.\n"
+    plan_parts = [
+        f"### {cr.dimension_name} (Score: {cr.final_score}/5)\n\n{cr.remediation}\n\n"
+        for cr in low_scores
+    ]
+    if not plan_parts:
+        plan_parts.append("No critical remediation required. All criteria scored 3/5 or higher.\n")
+    remediation_plan = "".join(plan_parts)
     
-    # Create AuditReport
+    # Create AuditReport (validated: the report boundary; per-criterion results above are
+    # built with model_construct since scores come from validated opinions and the fixed rules)
     audit_report = AuditReport(
         repo_url=state["repo_url"],
         executive_summary=executive_summary,
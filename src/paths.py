@@ -4,6 +4,7 @@ All file and directory paths used by the auditor are defined here
 so they can be changed in one place and stay consistent.
 """
 from pathlib import Path
+from typing import Tuple
 
 # Project root (parent of src/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -24,15 +25,37 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 # Temporary files (e.g. downloaded PDFs)
 TEMP_DIR = PROJECT_ROOT / "tmp"
 
+# Persistent caches shared across runs (e.g. judicial opinions)
+CACHE_DIR = Path.home() / ".cache" / "automaton_auditor"
+
+
+_STANDARD_DIRS = (AUDIT_DIR, REPORT_ON_SELF, REPORT_ON_PEER, REPORT_BY_PEER, REPORTS_DIR, TEMP_DIR)
+# Only leaf directories need creating; mkdir(parents=True) creates their ancestors (e.g. AUDIT_DIR)
+_LEAF_DIRS = tuple(d for d in _STANDARD_DIRS if not any(d in other.parents for other in _STANDARD_DIRS))
+
 
 def ensure_dirs() -> None:
     """Create standard directories if they do not exist."""
-    for dir_path in (AUDIT_DIR, REPORT_ON_SELF, REPORT_ON_PEER, REPORT_BY_PEER, REPORTS_DIR, TEMP_DIR):
-        dir_path.mkdir(parents=True, exist_ok=True)
+    for dir_path in _LEAF_DIRS:
+        if not dir_path.is_dir():
+            dir_path.mkdir(parents=True, exist_ok=True)
+
+
+# (RUBRIC_DIR mtime_ns, sorted rubric files) from the last scan; -1 = never scanned
+_rubric_files_cache: Tuple[int, Tuple[Path, ...]] = (-1, ())
 
 
 def list_rubric_files() -> list[Path]:
-    """Return list of JSON files in the rubric directory."""
-    if not RUBRIC_DIR.exists():
+    """Return list of JSON files in the rubric directory.
+
+    The directory is re-globbed only when its mtime changes (adding, removing or
+    renaming a rubric updates it), so repeated calls cost one stat().
+    """
+    global _rubric_files_cache
+    try:
+        mtime_ns = RUBRIC_DIR.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(RUBRIC_DIR.glob("*.json"))
+    if _rubric_files_cache[0] != mtime_ns:
+        _rubric_files_cache = (mtime_ns, tuple(sorted(RUBRIC_DIR.glob("*.json"))))
+    return list(_rubric_files_cache[1])
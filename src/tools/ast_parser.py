@@ -6,18 +6,91 @@ conditional edges, entry point), safe tool checks, and judge structured output.
 import ast
 import os
 import re
+from collections import Counter, deque
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 
 from src.utils.ast_cache import get_ast_cache
 
 # Expected graph node names for fan-out/fan-in verification (rubric)
-EXPECTED_DETECTIVE_NODES = {"repo_investigator", "doc_analyst", "vision_inspector"}
+EXPECTED_DETECTIVE_NODES = frozenset({"repo_investigator", "doc_analyst", "vision_inspector"})
 EXPECTED_SYNC_NODE = "evidence_aggregator"
-EXPECTED_JUDGE_NODES = {"prosecutor", "defense", "tech_lead"}
+EXPECTED_JUDGE_NODES = frozenset({"prosecutor", "defense", "tech_lead"})
 EXPECTED_CHIEF_NODE = "chief_justice"
 EXPECTED_ENTRY = "start"
 
+# Node names that count as a fan-in synchronization point
+_SYNC_NODE_NAME_RE = re.compile(r"aggregator|sync", re.IGNORECASE)
+
+# Cheap pre-filter for verify_safe_tool_engineering: only files mentioning os.system are AST-parsed
+_OS_SYSTEM_MENTION_RE = re.compile(r"\bos\s*\.\s*system\b")
+
+
+@lru_cache(maxsize=256)
+def _read_source_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a UTF-8 source file; (mtime_ns, size) in the key invalidates edited files."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_source(path: str) -> str:
+    """Read a source file once per run even when several verifiers inspect it."""
+    st = os.stat(path)
+    return _read_source_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _iter_py_files(root: str):
+    """Yield .py file paths under root (recursive, symlinked directories not followed).
+
+    Directories that cannot be listed are skipped, as os.walk does by default.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+def _file_fingerprint(repo_path: str, rel_paths: Tuple[str, ...]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime_ns, size) per file, or None when it is missing."""
+    fingerprint = []
+    for rel_path in rel_paths:
+        try:
+            st = os.stat(os.path.join(repo_path, rel_path))
+            fingerprint.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+def _memoize_by_files(*rel_paths: str):
+    """Memoize a verifier per (repo_path, fingerprint of the files it inspects).
+
+    Repeat calls on an unchanged repository return a copy of the cached result; any
+    edit to an inspected file changes the fingerprint. The wrapper exposes cache_clear().
+    """
+    def decorator(func):
+        @lru_cache(maxsize=128)
+        def cached(repo_path: str, _fingerprint: Tuple) -> Dict[str, Any]:
+            return func(repo_path)
+
+        @wraps(func)
+        def wrapper(repo_path: str) -> Dict[str, Any]:
+            return dict(cached(repo_path, _file_fingerprint(repo_path, rel_paths)))
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
 
 def _ast_arg_to_str(arg: ast.AST) -> Optional[str]:
     """Extract string value from AST node (Constant or Name)."""
@@ -28,6 +101,142 @@ def _ast_arg_to_str(arg: ast.AST) -> Optional[str]:
     return None
 
 
+class _GraphCallVisitor:
+    """Collect LangGraph builder calls (StateGraph, add_edge, add_conditional_edges, set_entry_point).
+
+    visit() drives an explicit worklist with exact type checks instead of ast.NodeVisitor's
+    per-node getattr dispatch, and skips ast.arguments subtrees (signatures and defaults
+    hold no builder calls).
+    """
+
+    def __init__(self):
+        self.has_stategraph = False
+        self.has_conditional_edges = False
+        self.has_set_entry_point = False
+        self.has_fan_out = False
+        self.has_fan_in = False
+        self.has_sync_like_node = False
+        self.edge_count = 0
+        self.source_nodes: Counter = Counter()
+        self.target_nodes: Counter = Counter()
+        self.edges: List[Tuple[str, str]] = []
+        self.all_nodes: Set[str] = set()
+        self.conditional_source: Optional[str] = None
+        self.entry_point_node: Optional[str] = None
+
+    def visit(self, tree: ast.AST) -> None:
+        Call, Attribute, arguments = ast.Call, ast.Attribute, ast.arguments
+        iter_child_nodes = ast.iter_child_nodes
+        handlers = self._HANDLERS
+        # FIFO like ast.walk, so edges are recorded in the same (breadth-first) order
+        queue = deque([tree])
+        pop, extend = queue.popleft, queue.extend
+        while queue:
+            node = pop()
+            node_type = type(node)
+            if node_type is arguments:
+                continue
+            if node_type is Call and type(node.func) is Attribute:
+                handler = handlers.get(node.func.attr)
+                if handler is not None:
+                    handler(self, node)
+            extend(iter_child_nodes(node))
+
+    def _on_stategraph(self, node: ast.Call) -> None:
+        self.has_stategraph = True
+
+    def _on_add_edge(self, node: ast.Call) -> None:
+        if len(node.args) < 2:
+            return
+        self.edge_count += 1
+        source = _ast_arg_to_str(node.args[0])
+        target = _ast_arg_to_str(node.args[1])
+        if source and target:
+            self.edges.append((source, target))
+            # Fan-out/fan-in are settled the moment a node's count reaches 2
+            out_count = self.source_nodes[source] + 1
+            self.source_nodes[source] = out_count
+            if out_count > 1:
+                self.has_fan_out = True
+            in_count = self.target_nodes[target] + 1
+            self.target_nodes[target] = in_count
+            if in_count > 1:
+                self.has_fan_in = True
+            self.all_nodes.add(source)
+            self.all_nodes.add(target)
+            if not self.has_sync_like_node and (
+                _SYNC_NODE_NAME_RE.search(source) or _SYNC_NODE_NAME_RE.search(target)
+            ):
+                self.has_sync_like_node = True
+
+    def _on_add_conditional_edges(self, node: ast.Call) -> None:
+        if node.args:
+            self.has_conditional_edges = True
+            self.conditional_source = _ast_arg_to_str(node.args[0])
+
+    def _on_set_entry_point(self, node: ast.Call) -> None:
+        if node.args:
+            self.has_set_entry_point = True
+            self.entry_point_node = _ast_arg_to_str(node.args[0])
+
+    # Method-attribute name -> handler: one dict probe per call; new builder APIs add an entry
+    _HANDLERS = {
+        "StateGraph": _on_stategraph,
+        "add_edge": _on_add_edge,
+        "add_conditional_edges": _on_add_conditional_edges,
+        "set_entry_point": _on_set_entry_point,
+    }
+
+
+class _StructuredOutputVisitor(ast.NodeVisitor):
+    """Detect .with_structured_output(...) / .bind_tools(...) calls and a JudicialOpinion schema.
+
+    Imports and function signatures hold no such calls and are not descended into, and
+    the walk stops once a JudicialOpinion schema call (which implies structured output)
+    has been seen.
+    """
+
+    def __init__(self):
+        self.has_structured_output = False
+        self.uses_judicial_opinion_schema = False
+
+    def visit(self, node: ast.AST) -> None:
+        if not self.uses_judicial_opinion_schema:
+            super().visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        pass
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        pass
+
+    def visit_arguments(self, node: ast.arguments) -> None:
+        pass
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Attribute):
+            handler = self._HANDLERS.get(node.func.attr)
+            if handler is not None:
+                handler(self, node)
+        self.generic_visit(node)
+
+    def _on_with_structured_output(self, node: ast.Call) -> None:
+        self.has_structured_output = True
+        if node.args and isinstance(node.args[0], ast.Name):
+            if node.args[0].id == "JudicialOpinion":
+                self.uses_judicial_opinion_schema = True
+
+    def _on_bind_tools(self, node: ast.Call) -> None:
+        if node.args:
+            self.has_structured_output = True
+
+    _HANDLERS = {
+        "with_structured_output": _on_with_structured_output,
+        "bind_tools": _on_bind_tools,
+    }
+
+
+@_memoize_by_files("src/state.py", "src/graph.py")
 def verify_state_models(repo_path: str) -> Dict[str, Any]:
     """Use AST to verify Pydantic state models exist.
     
@@ -47,16 +256,13 @@ def verify_state_models(repo_path: str) -> Dict[str, Any]:
         if os.path.exists(full_path):
             try:
                 # Try to get from cache first
-                tree = cache.get_ast(full_path)
+                # Source and tree come from one read; content is needed for the snippet
+                content, tree = cache.get_source_and_tree(full_path)
+                if content is None:
+                    content = _read_source(full_path)
                 if tree is None:
                     # Fallback to direct parsing if cache fails
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    tree = ast.parse(content)
-                else:
-                    # Read content for snippet extraction
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        content = f.read()
+                    tree = ast.parse(content, filename=full_path)
                 
                 # Look for BaseModel or TypedDict
                 has_pydantic = False
@@ -65,8 +271,10 @@ def verify_state_models(repo_path: str) -> Dict[str, Any]:
                 has_evidence_model = False
                 has_opinion_model = False
                 
+                # Single traversal: class bases/names and Annotated reducers are checked together
+                ClassDef, AnnAssign = ast.ClassDef, ast.AnnAssign
                 for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
+                    if isinstance(node, ClassDef):
                         # Check for BaseModel inheritance
                         for base in node.bases:
                             if isinstance(base, ast.Name) and base.id == "BaseModel":
@@ -84,9 +292,8 @@ def verify_state_models(repo_path: str) -> Dict[str, Any]:
                         if node.name == "JudicialOpinion":
                             has_opinion_model = True
                     
-                # Check for reducers: Annotated[..., operator.add] or operator.ior (AST)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.AnnAssign) and node.annotation:
+                    # Check for reducers: Annotated[..., operator.add] or operator.ior (AST)
+                    elif not has_reducers and isinstance(node, AnnAssign) and node.annotation:
                         ann = node.annotation
                         if isinstance(ann, ast.Subscript):
                             slice_val = ann.slice
@@ -97,10 +304,12 @@ def verify_state_models(repo_path: str) -> Dict[str, Any]:
                                 if getattr(slice_val.value, "id", None) == "operator":
                                     if slice_val.attr in ("add", "ior"):
                                         has_reducers = True
-                                        break
                             elif slice_val and isinstance(slice_val, ast.Name) and "operator" in content:
                                 has_reducers = True
-                                break
+                    
+                    # Every fact this verifier reports is confirmed: the rest of the tree cannot change it
+                    if has_reducers and has_evidence_model and has_opinion_model and (has_pydantic or has_typeddict):
+                        break
                 
                 if (has_pydantic or has_typeddict) and has_evidence_model and has_opinion_model:
                     # Extract relevant code snippet
@@ -142,6 +351,7 @@ def verify_state_models(repo_path: str) -> Dict[str, Any]:
     }
 
 
+@_memoize_by_files("src/graph.py")
 def analyze_graph_structure(repo_path: str) -> Dict[str, Any]:
     """Analyze LangGraph structure for parallel execution.
     
@@ -170,63 +380,36 @@ def analyze_graph_structure(repo_path: str) -> Dict[str, Any]:
     
     try:
         # Try to get from cache first
-        tree = cache.get_ast(graph_file)
+        # Source and tree come from one read; content is needed for structure extraction
+        content, tree = cache.get_source_and_tree(graph_file)
+        if content is None:
+            content = _read_source(graph_file)
         if tree is None:
             # Fallback to direct parsing
-            with open(graph_file, "r", encoding="utf-8") as f:
-                content = f.read()
-            tree = ast.parse(content)
-        else:
-            # Read content for structure extraction
-            with open(graph_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            tree = ast.parse(content, filename=graph_file)
         
         # Look for StateGraph, add_edge, add_conditional_edges, set_entry_point
-        has_stategraph = False
-        has_parallel_edges = False
-        has_conditional_edges = False
-        edge_count = 0
-        source_nodes: Dict[str, int] = {}
-        target_nodes: Dict[str, int] = {}
-        edges: List[Tuple[str, str]] = []
-        conditional_source: Optional[str] = None
-        entry_point_node: Optional[str] = None
-        has_set_entry_point = False
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-                attr = node.func.attr
-                if attr == "StateGraph":
-                    has_stategraph = True
-                if attr == "add_edge" and len(node.args) >= 2:
-                    edge_count += 1
-                    source = _ast_arg_to_str(node.args[0])
-                    target = _ast_arg_to_str(node.args[1])
-                    if source and target:
-                        edges.append((source, target))
-                        source_nodes[source] = source_nodes.get(source, 0) + 1
-                        target_nodes[target] = target_nodes.get(target, 0) + 1
-                if attr == "add_conditional_edges" and len(node.args) >= 1:
-                    has_conditional_edges = True
-                    conditional_source = _ast_arg_to_str(node.args[0])
-                if attr == "set_entry_point" and len(node.args) >= 1:
-                    has_set_entry_point = True
-                    entry_point_node = _ast_arg_to_str(node.args[0])
+        visitor = _GraphCallVisitor()
+        visitor.visit(tree)
+        has_stategraph = visitor.has_stategraph
+        has_conditional_edges = visitor.has_conditional_edges
+        edge_count = visitor.edge_count
+        edges = visitor.edges
+        conditional_source = visitor.conditional_source
+        entry_point_node = visitor.entry_point_node
+        has_set_entry_point = visitor.has_set_entry_point
 
         # Verify graph wiring: expected nodes and structure
-        all_node_names: Set[str] = set(source_nodes.keys()) | set(target_nodes.keys())
+        all_node_names = visitor.all_nodes
         has_detectives = EXPECTED_DETECTIVE_NODES.issubset(all_node_names)
         has_sync = EXPECTED_SYNC_NODE in all_node_names
         has_judges = EXPECTED_JUDGE_NODES.issubset(all_node_names)
         has_chief = EXPECTED_CHIEF_NODE in all_node_names
         entry_is_start = entry_point_node == EXPECTED_ENTRY
-        has_sync_node = has_sync or any(
-            "aggregator" in n.lower() or "sync" in n.lower()
-            for n in all_node_names
-        )
+        has_sync_node = has_sync or visitor.has_sync_like_node
 
-        has_fan_out = any(c > 1 for c in source_nodes.values())
-        has_fan_in = any(c > 1 for c in target_nodes.values())
+        has_fan_out = visitor.has_fan_out
+        has_fan_in = visitor.has_fan_in
         has_parallel_edges = has_fan_out or has_fan_in
 
         # Both conditional branches (to_judges and handle_failure_or_missing) must route to judicial layer
@@ -332,42 +515,46 @@ def verify_safe_tool_engineering(repo_path: str) -> Dict[str, Any]:
     has_error_handling = False
     tool_files = []
     
-    for root, dirs, files in os.walk(tools_dir):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                tool_files.append(file_path)
+    # Use AST cache for performance
+    cache = get_ast_cache()
+    
+    for file_path in _iter_py_files(tools_dir):
+        tool_files.append(file_path)
+        
+        try:
+            content = _read_source(file_path)
+            
+            # Flags only ever flip to True, so skip checks that are already settled
+            # Check for sandboxing
+            if not uses_sandboxing and ("tempfile" in content or "TemporaryDirectory" in content):
+                uses_sandboxing = True
+            
+            # Check for subprocess usage
+            if not uses_subprocess and "subprocess.run" in content:
+                uses_subprocess = True
+            
+            # Only flag actual os.system(...) calls (AST), not string checks or comments;
+            # files that never mention os.system skip the parse entirely
+            if not has_os_system and _OS_SYSTEM_MENTION_RE.search(content):
+                tree = cache.get_ast(file_path)
+                if tree is not None:
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.Call):
+                            if isinstance(node.func, ast.Attribute):
+                                if getattr(node.func.value, "id", None) == "os" and node.func.attr == "system":
+                                    has_os_system = True
+                                    break
+            
+            # Check for error handling
+            if not has_error_handling and "try:" in content and "except" in content:
+                has_error_handling = True
                 
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    
-                    # Check for sandboxing
-                    if "tempfile" in content or "TemporaryDirectory" in content:
-                        uses_sandboxing = True
-                    
-                    # Check for subprocess usage
-                    if "subprocess" in content and "subprocess.run" in content:
-                        uses_subprocess = True
-                    
-                    # Only flag actual os.system(...) calls (AST), not string checks or comments
-                    try:
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.Call):
-                                if isinstance(node.func, ast.Attribute):
-                                    if getattr(node.func.value, "id", None) == "os" and node.func.attr == "system":
-                                        has_os_system = True
-                                        break
-                    except SyntaxError:
-                        pass
-                    
-                    # Check for error handling
-                    if "try:" in content and "except" in content:
-                        has_error_handling = True
-                        
-                except Exception:
-                    continue
+        except Exception:
+            continue
+        
+        # Every flag is set: remaining files cannot change the result
+        if uses_sandboxing and uses_subprocess and has_os_system and has_error_handling:
+            break
     
     is_safe = uses_sandboxing and uses_subprocess and not has_os_system and has_error_handling
     
@@ -390,6 +577,7 @@ def verify_safe_tool_engineering(repo_path: str) -> Dict[str, Any]:
     }
 
 
+@_memoize_by_files("src/nodes/judges.py")
 def verify_structured_output(repo_path: str) -> Dict[str, Any]:
     """Verify structured output enforcement in judge nodes.
 
@@ -409,24 +597,18 @@ def verify_structured_output(repo_path: str) -> Dict[str, Any]:
         }
 
     try:
-        with open(judges_file, "r", encoding="utf-8") as f:
-            content = f.read()
-        tree = ast.parse(content)
+        # Use AST cache for performance (falls back to a direct parse, which surfaces syntax errors)
+        content, tree = get_ast_cache().get_source_and_tree(judges_file)
+        if content is None:
+            content = _read_source(judges_file)
+        tree = tree or ast.parse(content, filename=judges_file)
 
-        has_structured_output = False
-        uses_judicial_opinion_schema = False
         has_retry = "retry" in content.lower() or ("try:" in content and "except" in content)
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-                attr = node.func.attr
-                if attr == "with_structured_output":
-                    has_structured_output = True
-                    if node.args and isinstance(node.args[0], ast.Name):
-                        if node.args[0].id == "JudicialOpinion":
-                            uses_judicial_opinion_schema = True
-                if attr == "bind_tools" and node.args:
-                    has_structured_output = True
+        visitor = _StructuredOutputVisitor()
+        visitor.visit(tree)
+        has_structured_output = visitor.has_structured_output
+        uses_judicial_opinion_schema = visitor.uses_judicial_opinion_schema
 
         uses_pydantic = uses_judicial_opinion_schema or (
             "JudicialOpinion" in content and "with_structured_output" in content
@@ -8,12 +8,15 @@ import os
 import re
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-# Safe URL pattern: http(s) or git@ (SSH); avoid file:// and shell metacharacters
+# Safe URL pattern: http(s) or git@ (SSH); avoid file:// and shell metacharacters.
+# Whitespace, ';' and '|' are excluded by the character classes, so one fullmatch
+# is the whole check.
 REPO_URL_PATTERN = re.compile(
-    r"^(https?://[^\s<>'\"]+|git@[a-zA-Z0-9.-]+:[a-zA-Z0-9_.-/]+\.git?)$"
+    r"https?://[^\s<>'\";|]+|git@[a-zA-Z0-9.-]+:[a-zA-Z0-9_.-/]+\.git?"
 )
 
 
@@ -21,19 +24,22 @@ def is_valid_repo_url(url: str) -> bool:
     """Return True if url looks like a safe repo URL (http(s) or git@)."""
     if not url or not isinstance(url, str):
         return False
-    url = url.strip()
-    if " " in url or "\n" in url or ";" in url or "|" in url:
-        return False
-    return bool(REPO_URL_PATTERN.match(url))
+    return _is_valid_repo_url_cached(url)
+
+
+@lru_cache(maxsize=256)
+def _is_valid_repo_url_cached(url: str) -> bool:
+    """Regex check for a non-empty str URL; pure, so repeat URLs are a dict lookup."""
+    return REPO_URL_PATTERN.fullmatch(url.strip()) is not None
 
 
 def _ensure_sandbox_dir(target_dir: Optional[str]) -> tuple[str, bool]:
     """Return (repo_parent_dir, is_temp). Never use cwd as repo parent."""
     if target_dir is None or not target_dir.strip():
         return tempfile.mkdtemp(), True
+    # abspath() is already normalized and getcwd() is absolute, so plain equality suffices
     abs_path = os.path.abspath(target_dir)
-    cwd = os.getcwd()
-    if os.path.normpath(abs_path) == os.path.normpath(cwd):
+    if abs_path == os.getcwd():
         # Caller passed cwd: use a temp dir instead to avoid cloning into live dir
         return tempfile.mkdtemp(), True
     os.makedirs(abs_path, exist_ok=True)
@@ -52,7 +58,13 @@ def _classify_clone_error(stderr: str) -> str:
     return (stderr or "Unknown git error").strip() or "Git clone failed."
 
 
-def clone_repo(repo_url: str, target_dir: Optional[str] = None) -> str:
+def clone_repo(
+    repo_url: str,
+    target_dir: Optional[str] = None,
+    depth: Optional[int] = None,
+    blobless: bool = False,
+    checkout: bool = True,
+) -> str:
     """Safely clone a repository into a temporary (or provided) directory.
 
     - Never clones into the current working directory; uses temp if target_dir is cwd.
@@ -63,6 +75,9 @@ def clone_repo(repo_url: str, target_dir: Optional[str] = None) -> str:
     Args:
         repo_url: Git repository URL (https or git@).
         target_dir: Optional parent dir for clone; if None or cwd, uses tempfile.
+        depth: Optional history depth (--depth); leave None when commit history is analyzed.
+        blobless: Skip blobs not needed for the checkout (--filter=blob:none).
+        checkout: Set False to skip the working tree (--no-checkout) when only paths are read.
 
     Returns:
         Path to cloned repository (subdir named "repo" under parent).
@@ -80,9 +95,19 @@ def clone_repo(repo_url: str, target_dir: Optional[str] = None) -> str:
     parent_dir, _ = _ensure_sandbox_dir(target_dir)
     repo_path = os.path.join(parent_dir, "repo")
 
+    cmd = ["git", "clone"]
+    if depth:
+        # --depth already implies --single-branch
+        cmd += ["--depth", str(depth), "--no-tags"]
+    if blobless:
+        cmd.append("--filter=blob:none")
+    if not checkout:
+        cmd.append("--no-checkout")
+    cmd += [repo_url, repo_path]
+
     try:
         subprocess.run(
-            ["git", "clone", repo_url, repo_path],
+            cmd,
             check=True,
             capture_output=True,
             text=True,
@@ -109,7 +134,7 @@ def _is_git_repo(path: str) -> bool:
 
 
 def get_repo_file_list(repo_url: str) -> List[str]:
-    """Clone repo to a temp dir and return relative file paths (normalized with forward slashes).
+    """Clone repo to a temp dir and return its tracked files as relative forward-slash paths.
 
     Used for cross-referencing PDF claims. Returns [] on clone failure, invalid URL,
     auth error, or non-git path. Never writes outside a temp dir.
@@ -118,17 +143,19 @@ def get_repo_file_list(repo_url: str) -> List[str]:
         return []
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = clone_repo(repo_url, tmpdir)
+            # Only the paths of the current tree are listed: no history, no file contents
+            repo_path = clone_repo(repo_url, tmpdir, depth=1, blobless=True, checkout=False)
             if not _is_git_repo(repo_path):
                 return []
-            out: List[str] = []
-            for root, _dirs, files in os.walk(repo_path):
-                for f in files:
-                    abs_path = os.path.join(root, f)
-                    rel = os.path.relpath(abs_path, repo_path)
-                    out.append(rel.replace("\\", "/"))
-            return out
-    except (ValueError, RuntimeError, OSError):
+            # Paths straight from HEAD's tree objects: relative, forward-slashed, no walk
+            result = subprocess.run(
+                ["git", "-C", repo_path, "ls-tree", "-r", "--name-only", "-z", "HEAD"],
+                capture_output=True,
+                check=True,
+                timeout=30,
+            )
+            return [os.fsdecode(p) for p in result.stdout.split(b"\0") if p]
+    except (ValueError, RuntimeError, OSError, subprocess.SubprocessError):
         return []
 
 
@@ -148,14 +175,24 @@ def analyze_git_history(repo_path: str) -> Dict[str, Any]:
         }
 
     try:
+        # One git log for both views: "<short hash> <subject>" lines and author dates.
+        # NUL-terminated records: subjects may contain any line-breaking character but NUL.
         result = subprocess.run(
-            ["git", "-C", repo_path, "log", "--oneline", "--reverse"],
+            ["git", "-C", repo_path, "log", "--reverse", "-z", "--pretty=format:%h%x09%ai%x09%s"],
             capture_output=True,
             text=True,
             check=True,
             timeout=30,
         )
-        commits = [line.strip() for line in (result.stdout or "").strip().split("\n") if line.strip()]
+        commits: List[str] = []
+        timestamps: List[str] = []
+        for record in (result.stdout or "").split("\0"):
+            parts = record.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            short_hash, timestamp, subject = parts
+            commits.append(f"{short_hash} {subject}".strip())
+            timestamps.append(timestamp)
 
         # Empty repo: no commits
         if not commits:
@@ -168,19 +205,6 @@ def analyze_git_history(repo_path: str) -> Dict[str, Any]:
                 "confidence": 0.2,
             }
 
-        timestamp_result = subprocess.run(
-            ["git", "-C", repo_path, "log", "--format=%ai", "--reverse"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
-        )
-        timestamps = [
-            line.strip()
-            for line in (timestamp_result.stdout or "").strip().split("\n")
-            if line.strip()
-        ]
-
         has_progression = len(commits) > 3
         single_init = len(commits) == 1 and ("init" in commits[0].lower() or "initial" in commits[0].lower())
         bulk_pattern = any("bulk" in c.lower() for c in commits[:3])
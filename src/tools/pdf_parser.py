@@ -3,6 +3,10 @@
 Includes semantic chunking (by section/paragraph), query APIs to find relevant
 chunks by keywords or overlap scoring, and cross-reference verification.
 """
+import hashlib
+import heapq
+import importlib.util
+import os
 import re
 import tempfile
 import urllib.error
@@ -10,6 +14,8 @@ import urllib.request
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+from src.paths import CACHE_DIR
+
 # Try to import DocumentConverter with fallback
 try:
     from docling.document_converter import DocumentConverter
@@ -22,6 +28,12 @@ except ImportError:
         DOCLING_AVAILABLE = False
         DocumentConverter = None
 
+# Extracted text cache: keyed by SHA256(PDF bytes) and parser backend, least-recently-used
+# entries beyond the cap are evicted. Bump the version when extraction output changes.
+PDF_TEXT_CACHE_VERSION = "1"
+PDF_TEXT_CACHE_DIR = CACHE_DIR / "pdf"
+PDF_TEXT_CACHE_MAX_ENTRIES = 10
+
 
 def is_pdf_url(value: str) -> bool:
     """Return True if value looks like an HTTP(S) URL (for PDF)."""
@@ -97,11 +109,60 @@ def download_pdf_from_url(url: str, dest_dir: str = None) -> str:
     return str(dest_path.resolve())
 
 
-def parse_pdf(pdf_path: str) -> str:
+def _primary_pdf_backend() -> str:
+    """Name of the extractor _extract_pdf_text tries first in this environment."""
+    if DOCLING_AVAILABLE and DocumentConverter:
+        return "docling"
+    return "pypdf" if importlib.util.find_spec("pypdf") else "pypdf2"
+
+
+def _pdf_cache_path(digest: str, backend: str) -> Path:
+    """Cache file for a PDF's extracted text (content hash + producing backend + version)."""
+    return PDF_TEXT_CACHE_DIR / f"{digest}-{backend}-v{PDF_TEXT_CACHE_VERSION}.md"
+
+
+def _load_cached_pdf_text(cache_path: Path) -> Optional[str]:
+    """Return cached text and mark the entry recently used, or None on miss or cache error."""
+    try:
+        text = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)
+        return text
+    except OSError:
+        return None
+
+
+def _store_pdf_text(cache_path: Path, text: str) -> None:
+    """Write text to the cache (best effort, atomic rename) and evict least-recently-used entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        entries = sorted(
+            cache_path.parent.glob("*.md"), key=lambda p: p.stat().st_mtime_ns, reverse=True
+        )
+        for stale in entries[PDF_TEXT_CACHE_MAX_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def parse_pdf(pdf_path: str, use_cache: bool = True) -> str:
     """Parse PDF and extract text content using Docling.
     
+    Extracted text is cached on disk by PDF content hash and the extractor that
+    produced it, so re-auditing the same report skips the (slow) conversion. Only
+    text from the extractor tried first is served from the cache, and text with
+    failed pages is never stored. Cache failures fall through to parsing.
+    
     Args:
         pdf_path: Path to PDF file
+        use_cache: Read and write the extracted-text cache (default True)
         
     Returns:
         Extracted text content as string
@@ -115,6 +176,24 @@ def parse_pdf(pdf_path: str) -> str:
     if not pdf_file.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
+    if not use_cache:
+        return _extract_pdf_text(pdf_file)[0]
+    
+    digest = hashlib.sha256(pdf_file.read_bytes()).hexdigest()
+    text = _load_cached_pdf_text(_pdf_cache_path(digest, _primary_pdf_backend()))
+    if text is None:
+        text, backend, complete = _extract_pdf_text(pdf_file)
+        if complete:
+            _store_pdf_text(_pdf_cache_path(digest, backend), text)
+    return text
+
+
+def _extract_pdf_text(pdf_file: Path) -> Tuple[str, str, bool]:
+    """Extract text with Docling, falling back to pypdf, then PyPDF2.
+
+    Returns:
+        (text, backend that produced it, False if any page failed to extract)
+    """
     # Try Docling first (if available and working)
     if DOCLING_AVAILABLE and DocumentConverter:
         try:
@@ -122,12 +201,12 @@ def parse_pdf(pdf_path: str) -> str:
             doc = converter.convert(str(pdf_file))
             # Handle different docling API versions
             if hasattr(doc, 'document'):
-                return doc.document.export_to_markdown()
+                return doc.document.export_to_markdown(), "docling", True
             elif hasattr(doc, 'export_to_markdown'):
-                return doc.export_to_markdown()
+                return doc.export_to_markdown(), "docling", True
             else:
                 # Fallback: try to get text content
-                return str(doc)
+                return str(doc), "docling", True
         except (OSError, ImportError, Exception) as e:
             # If docling fails (e.g., Windows security policy blocking pypdfium2),
             # fall back to pypdf
@@ -139,13 +218,15 @@ def parse_pdf(pdf_path: str) -> str:
         with open(pdf_file, 'rb') as file:
             pdf_reader = pypdf.PdfReader(file)
             text_content = []
+            complete = True
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
                     text_content.append(page.extract_text())
                 except Exception as page_error:
                     # Skip pages that fail to extract
                     text_content.append(f"[Page {page_num + 1}: Extraction failed]")
-            return '\n'.join(text_content)
+                    complete = False
+            return '\n'.join(text_content), "pypdf", complete
     except ImportError:
         # If pypdf is not available, try PyPDF2
         try:
@@ -155,7 +236,7 @@ def parse_pdf(pdf_path: str) -> str:
                 text_content = []
                 for page in pdf_reader.pages:
                     text_content.append(page.extract_text())
-                return '\n'.join(text_content)
+                return '\n'.join(text_content), "pypdf2", True
         except ImportError:
             raise RuntimeError(
                 "PDF parsing failed: Neither docling, pypdf, nor PyPDF2 are available. "
@@ -176,12 +257,14 @@ def extract_keywords(pdf_content: str, keywords: List[str]) -> Dict[str, List[st
         Dictionary mapping keyword to list of sentences containing it
     """
     results = {keyword: [] for keyword in keywords}
+    # Lowercase each keyword once, not once per sentence
+    keywords_lower = [(keyword, keyword.lower()) for keyword in keywords]
     sentences = pdf_content.split('.')
     
     for sentence in sentences:
         sentence_lower = sentence.lower()
-        for keyword in keywords:
-            if keyword.lower() in sentence_lower:
+        for keyword, keyword_lower in keywords_lower:
+            if keyword_lower in sentence_lower:
                 results[keyword].append(sentence.strip())
     
     return results
@@ -192,32 +275,33 @@ def _normalize_path_for_match(p: str) -> str:
     return p.strip().replace("\\", "/").lstrip("./").lower()
 
 
+# Project-relevant path patterns (avoid matching random "foo.py" in text), as one alternation
+_CLAIMED_PATH_RE = re.compile(
+    r"src/[^\s\)\]\"]+\.py"
+    r"|rubric/[^\s\)\]\"]+\.json"
+    r"|docs/[^\s\)\]\"]+"
+    r"|tests/[^\s\)\]\"]+\.py"
+    r"|main\.py"
+)
+
+
 def verify_file_claims(pdf_content: str, repo_files: List[str]) -> Dict[str, bool]:
     """Cross-reference file paths mentioned in PDF with actual repository files.
 
     Uses case-insensitive and slash-normalized matching so e.g. src/State.py
     matches repo file src/state.py. Only counts paths that look like project paths
     (src/, rubric/, docs/, tests/, main.py) to reduce false positives from generic .py mentions.
+    The text is scanned once; a matched path is not re-scanned for shorter paths inside it
+    (e.g. "src/main.py" does not also claim a root "main.py").
     """
     mentioned_files: Dict[str, bool] = {}
-    repo_normalized = {_normalize_path_for_match(f): f for f in repo_files}
-
-    # Prefer project-relevant path patterns to avoid matching random "foo.py" in text
-    file_patterns = [
-        r"src/[^\s\)\]\"]+\.py",
-        r"rubric/[^\s\)\]\"]+\.json",
-        r"docs/[^\s\)\]\"]+",
-        r"tests/[^\s\)\]\"]+\.py",
-        r"main\.py",
-    ]
-
-    for pattern in file_patterns:
-        for match in re.findall(pattern, pdf_content):
-            key = match.strip().replace("\\", "/").lstrip("./")
-            if not key or key in mentioned_files:
-                continue
-            key_norm = _normalize_path_for_match(key)
-            mentioned_files[key] = key_norm in repo_normalized
+    repo_normalized = frozenset(_normalize_path_for_match(f) for f in repo_files)
+
+    for match in _CLAIMED_PATH_RE.finditer(pdf_content):
+        key = match.group(0).strip().replace("\\", "/").lstrip("./")
+        if not key or key in mentioned_files:
+            continue
+        mentioned_files[key] = _normalize_path_for_match(key) in repo_normalized
 
     return mentioned_files
 
@@ -236,7 +320,8 @@ def chunk_pdf_semantic(
     """Split PDF text into semantic chunks (by section/paragraph) for retrieval.
 
     Chunks respect section boundaries when possible (headers, double newlines).
-    Each chunk has 'text', 'start', 'end' (byte offsets), and optional 'section' title.
+    Each chunk has 'text', 'text_lower' (lowercased once for scoring), 'start', 'end'
+    (byte offsets), and optional 'section' title.
 
     Args:
         pdf_content: Full extracted PDF text.
@@ -244,7 +329,8 @@ def chunk_pdf_semantic(
         overlap_chars: Overlap between consecutive chunks to avoid breaking phrases.
 
     Returns:
-        List of dicts: {"text": str, "start": int, "end": int, "section": str or None}.
+        List of dicts: {"text": str, "text_lower": str, "start": int, "end": int,
+        "section": str or None}.
     """
     if not pdf_content or not pdf_content.strip():
         return []
@@ -298,6 +384,7 @@ def chunk_pdf_semantic(
                 full = " \n".join(current_text)
                 chunks.append({
                     "text": full,
+                    "text_lower": full.lower(),
                     "start": chunk_start,
                     "end": chunk_start + len(full),
                     "section": chunk_section,
@@ -314,6 +401,7 @@ def chunk_pdf_semantic(
         full = " \n".join(current_text)
         chunks.append({
             "text": full,
+            "text_lower": full.lower(),
             "start": chunk_start,
             "end": chunk_start + len(full),
             "section": chunk_section,
@@ -321,10 +409,9 @@ def chunk_pdf_semantic(
     return chunks
 
 
-def _chunk_score(chunk_text: str, query_terms: List[str]) -> float:
-    """Score a chunk by keyword overlap (case-insensitive)."""
-    lower = chunk_text.lower()
-    return sum(1 for t in query_terms if t.lower() in lower)
+def _chunk_score(chunk_text_lower: str, query_terms_lower: List[str]) -> float:
+    """Score a chunk by keyword overlap (both sides already lowercased)."""
+    return sum(1 for t in query_terms_lower if t in chunk_text_lower)
 
 
 def query_pdf_chunks(
@@ -352,14 +439,20 @@ def query_pdf_chunks(
     if not terms:
         return chunks[:top_k]
 
+    terms_lower = [t.lower() for t in terms]
     scored: List[Dict[str, Any]] = []
     for c in chunks:
-        text = c.get("text", "")
-        score = _chunk_score(text, terms)
-        scored.append({**c, "score": score})
-
-    scored.sort(key=lambda x: (-x["score"], len(x.get("text", ""))))
-    return [c for c in scored if c["score"] > 0][:top_k]
+        # chunk_pdf_semantic() precomputes text_lower; lower other chunks here
+        text_lower = c.get("text_lower")
+        if text_lower is None:
+            text_lower = c.get("text", "").lower()
+        score = _chunk_score(text_lower, terms_lower)
+        # Zero-score chunks are never returned, so they are not copied
+        if score > 0:
+            scored.append({**c, "score": score})
+
+    # Same order as sorted(...)[:top_k], without sorting the whole list
+    return heapq.nsmallest(top_k, scored, key=lambda x: (-x["score"], len(x.get("text", ""))))
 
 
 def get_pdf_chunks_for_keywords(
@@ -1,69 +1,73 @@
 """AST parsing cache for performance optimization."""
 import ast
 import hashlib
-from functools import lru_cache
-from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Optional, Tuple
 
 
 class ASTCache:
-    """Cache for parsed AST trees to avoid re-parsing unchanged files."""
-    
+    """Cache for parsed AST trees to avoid re-parsing unchanged files.
+
+    Trees are kept in memory per file path and reused while the file's SHA256 is unchanged.
+    """
+
     def __init__(self):
         """Initialize the cache."""
         self._cache: Dict[str, ast.AST] = {}
         self._file_hashes: Dict[str, str] = {}
-    
-    def _get_file_hash(self, file_path: str) -> str:
-        """Get hash of file contents for cache invalidation.
-        
-        Args:
-            file_path: Path to file
-            
-        Returns:
-            SHA256 hash of file contents
-        """
-        try:
-            with open(file_path, "rb") as f:
-                content = f.read()
-            return hashlib.sha256(content).hexdigest()
-        except Exception:
-            return ""
-    
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
     def get_ast(self, file_path: str) -> Optional[ast.AST]:
         """Get cached AST or parse and cache.
-        
+
         Args:
             file_path: Path to Python file
-            
+
         Returns:
             Parsed AST tree or None if parsing fails
         """
-        if not Path(file_path).exists():
-            return None
-        
-        current_hash = self._get_file_hash(file_path)
-        
+        return self.get_source_and_tree(file_path)[1]
+
+    def get_source_and_tree(self, file_path: str) -> Tuple[Optional[str], Optional[ast.AST]]:
+        """Get a file's source text and its (cached) AST from a single read.
+
+        Source uses universal newlines, like reading the file in text mode.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            (source, tree); source is None if the file cannot be read or decoded,
+            tree is None if it cannot be parsed
+        """
+        # Read once: the same bytes feed the hash, the parser and the returned source
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            source = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except (OSError, UnicodeDecodeError):
+            return None, None
+
+        current_hash = hashlib.sha256(data).hexdigest()
+
         # Check if file has changed
-        if file_path in self._file_hashes:
-            if self._file_hashes[file_path] == current_hash:
-                # File unchanged, return cached AST
-                return self._cache.get(file_path)
-        
+        if self._file_hashes.get(file_path) == current_hash:
+            # File unchanged, return cached AST
+            self.stats["hits"] += 1
+            return source, self._cache.get(file_path)
+
         # Parse and cache
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            self._cache[file_path] = tree
-            self._file_hashes[file_path] = current_hash
-            return tree
+            tree = ast.parse(source, filename=file_path)
         except SyntaxError:
-            return None
+            return source, None
         except Exception:
-            return None
-    
+            return source, None
+        self.stats["misses"] += 1
+
+        self._cache[file_path] = tree
+        self._file_hashes[file_path] = current_hash
+        return source, tree
+
     def clear(self):
         """Clear the cache."""
         self._cache.clear()
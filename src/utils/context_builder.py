@@ -38,6 +38,17 @@ def get_forensic_instructions(rubric: Dict[str, Any], criterion_id: str) -> str:
     raise ValueError(f"Criterion ID not found: {criterion_id}")
 
 
+def _judicial_logic_for_dimension(dim: Dict[str, Any], persona: str) -> str:
+    """Resolve a persona's judicial logic from one dimension dict (with pattern fallback)."""
+    logic = dim.get("judicial_logic")
+    if logic and isinstance(logic, dict) and persona in logic:
+        return logic[persona]
+    # Fallback when rubric has no judicial_logic (e.g. forensic-only spec)
+    success = dim.get("success_pattern", "Criteria met.")
+    failure = dim.get("failure_pattern", "Criteria not met.")
+    return f"Success: {success}. Failure: {failure}. Evaluate as {persona}."
+
+
 def get_judicial_logic(rubric: Dict[str, Any], criterion_id: str, persona: str) -> str:
     """Get judicial logic for a specific criterion and persona.
 
@@ -52,16 +63,23 @@ def get_judicial_logic(rubric: Dict[str, Any], criterion_id: str, persona: str)
     """
     for dim in rubric.get("dimensions", []):
         if dim.get("id") == criterion_id:
-            logic = dim.get("judicial_logic")
-            if logic and isinstance(logic, dict) and persona in logic:
-                return logic[persona]
-            # Fallback when rubric has no judicial_logic (e.g. forensic-only spec)
-            success = dim.get("success_pattern", "Criteria met.")
-            failure = dim.get("failure_pattern", "Criteria not met.")
-            return f"Success: {success}. Failure: {failure}. Evaluate as {persona}."
+            return _judicial_logic_for_dimension(dim, persona)
     raise ValueError(f"Criterion ID not found: {criterion_id}")
 
 
+def build_judicial_logic_map(dimensions: List[Dict[str, Any]], persona: str) -> Dict[str, str]:
+    """Resolve judicial logic for every dimension in a single pass.
+
+    Args:
+        dimensions: Rubric dimensions (each with an "id" key).
+        persona: One of "prosecutor", "defense", "tech_lead".
+
+    Returns:
+        Dictionary mapping criterion ID to the persona's judicial logic string.
+    """
+    return {dim["id"]: _judicial_logic_for_dimension(dim, persona) for dim in dimensions}
+
+
 def get_synthesis_rules(rubric: Dict[str, Any]) -> Dict[str, str]:
     """Get synthesis rules from rubric.
     
@@ -0,0 +1,116 @@
+"""On-disk cache of judicial opinions keyed by prompt content hash."""
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from src.paths import CACHE_DIR
+from src.state import JudicialOpinion
+
+# Bump when the key composition or stored JudicialOpinion shape changes to invalidate old entries
+OPINION_CACHE_VERSION = "1"
+
+# Least-recently-used rows beyond this count are deleted on put (one run writes ~3 per criterion)
+OPINION_CACHE_MAX_ENTRIES = 500
+
+
+class OpinionCache:
+    """SQLite-backed cache of parsed JudicialOpinion JSON.
+
+    Identical (judge, model, temperature, system prompt, user prompt) inputs map to
+    the same key, so re-runs on an unchanged evidence bundle skip the LLM call. The
+    user prompt carries the criterion, judicial logic and evidence (goal, content,
+    found, confidence) but not evidence UUIDs, which are regenerated every run; the
+    system prompt text and OPINION_CACHE_VERSION salt the key so prompt edits miss.
+    Cache failures are swallowed: a broken cache must never break a judge.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, max_entries: int = OPINION_CACHE_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file path (default: paths.CACHE_DIR / "opinions.sqlite3")
+            max_entries: Rows kept after each put, least recently used evicted first
+        """
+        self.db_path = Path(db_path) if db_path else CACHE_DIR / "opinions.sqlite3"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def make_key(judge_name: str, model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+        """Build the content-hash key for one judge invocation.
+
+        Returns:
+            128-bit BLAKE2b hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (OPINION_CACHE_VERSION, judge_name, model, str(temperature), system_prompt, user_prompt):
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the table on first use."""
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    with closing(sqlite3.connect(self.db_path, timeout=10)) as conn, conn:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS opinions (key TEXT PRIMARY KEY, opinion TEXT NOT NULL)"
+                        )
+                        # Caches created before LRU trimming lack last_used
+                        columns = {row[1] for row in conn.execute("PRAGMA table_info(opinions)")}
+                        if "last_used" not in columns:
+                            conn.execute("ALTER TABLE opinions ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+                        conn.execute("CREATE INDEX IF NOT EXISTS opinions_last_used ON opinions (last_used)")
+                    self._initialized = True
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def get(self, key: str) -> Optional[JudicialOpinion]:
+        """Return the cached opinion for key, or None on miss or cache error."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute("SELECT opinion FROM opinions WHERE key = ?", (key,)).fetchone()
+                if row:
+                    conn.execute("UPDATE opinions SET last_used = ? WHERE key = ?", (time.time(), key))
+            return JudicialOpinion.model_validate_json(row[0]) if row else None
+        except Exception:
+            return None
+
+    def put(self, key: str, opinion: JudicialOpinion) -> None:
+        """Store opinion under key and trim to max_entries (best effort)."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO opinions (key, opinion, last_used) VALUES (?, ?, ?)",
+                    (key, opinion.model_dump_json(), time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM opinions WHERE key NOT IN "
+                    "(SELECT key FROM opinions ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except Exception:
+            pass
+
+    def clear(self):
+        """Clear the cache."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM opinions")
+        except Exception:
+            pass
+
+
+# Global cache instance
+_global_cache = OpinionCache()
+
+
+def get_opinion_cache() -> OpinionCache:
+    """Get the global opinion cache instance."""
+    return _global_cache
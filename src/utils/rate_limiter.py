@@ -1,4 +1,6 @@
 """Rate limiting utilities for OpenAI API calls."""
+import asyncio
+import threading
 import time
 from typing import Optional
 from collections import deque
@@ -17,6 +19,8 @@ class RateLimiter:
         self.max_calls = max_calls
         self.time_window = time_window
         self.call_times = deque()
+        # Judges run in parallel threads, each with its own event loop
+        self._lock = threading.Lock()
     
     def acquire(self) -> bool:
         """Try to acquire a rate limit slot.
@@ -24,19 +28,20 @@ class RateLimiter:
         Returns:
             True if call is allowed, False if rate limit exceeded
         """
-        now = time.time()
-        
-        # Remove old call times outside the window
-        while self.call_times and self.call_times[0] < now - self.time_window:
-            self.call_times.popleft()
-        
-        # Check if we're at the limit
-        if len(self.call_times) >= self.max_calls:
-            return False
-        
-        # Record this call
-        self.call_times.append(now)
-        return True
+        with self._lock:
+            now = time.time()
+            
+            # Remove old call times outside the window
+            while self.call_times and self.call_times[0] < now - self.time_window:
+                self.call_times.popleft()
+            
+            # Check if we're at the limit
+            if len(self.call_times) >= self.max_calls:
+                return False
+            
+            # Record this call
+            self.call_times.append(now)
+            return True
     
     def wait_if_needed(self) -> float:
         """Wait if rate limit would be exceeded, return wait time.
@@ -62,6 +67,24 @@ class RateLimiter:
         return 0.0
 
 
+    async def async_wait_if_needed(self) -> float:
+        """Async variant of wait_if_needed for concurrent callers on an event loop.
+        
+        Sleeps with asyncio.sleep (other tasks keep running) until a slot is acquired.
+        
+        Returns:
+            Number of seconds waited (0 if no wait needed)
+        """
+        waited = 0.0
+        while not self.acquire():
+            with self._lock:
+                oldest_call = self.call_times[0] if self.call_times else time.time()
+            wait_time = max(self.time_window - (time.time() - oldest_call) + 0.1, 0.1)
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+        return waited
+
+
 # Global rate limiter instance (60 calls per minute default)
 _global_rate_limiter = RateLimiter(max_calls=60, time_window=60)
 
@@ -1,4 +1,6 @@
 """Integration tests for graph orchestration."""
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -51,8 +53,7 @@ class TestGraphOrchestration:
     @patch('src.nodes.detectives.analyze_graph_structure')
     @patch('src.nodes.detectives.parse_pdf')
     @patch('src.nodes.judges.ChatOpenAI')
-    @patch('src.nodes.justice.load_rubric')
-    def test_graph_execution_flow(self, mock_rubric, mock_llm, mock_pdf, mock_graph, 
+    def test_graph_execution_flow(self, mock_llm, mock_pdf, mock_graph, 
                                    mock_state, mock_git, mock_clone, sample_state):
         """Test that graph executes through all layers."""
         # Mock all dependencies
@@ -81,15 +82,41 @@ class TestGraphOrchestration:
         mock_llm_instance.with_structured_output.return_value = mock_chain
         mock_llm.return_value = mock_llm_instance
         
-        mock_rubric.return_value = {"synthesis_rules": {}}
-        
         graph = build_auditor_graph()
         
         with patch('tempfile.TemporaryDirectory') as mock_tmp:
             mock_tmp.return_value.__enter__.return_value = "/tmp"
-            with patch('src.nodes.judges.ChatPromptTemplate'):
-                with patch('src.nodes.judges.get_rate_limiter') as mock_rate:
-                    mock_rate.return_value.wait_if_needed.return_value = 0.0
-                    # Graph execution would happen here
-                    # For now, just verify graph is buildable
-                    assert graph is not None
+            with patch('src.nodes.judges.get_rate_limiter') as mock_rate:
+                mock_rate.return_value.wait_if_needed.return_value = 0.0
+                # Graph execution would happen here
+                # For now, just verify graph is buildable
+                assert graph is not None
+
+    def test_judges_run_concurrently(self, sample_state):
+        """Prosecutor, Defense and Tech Lead run as parallel branches and merge before chief_justice."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_judge(judge):
+            def node(state):
+                # Deadlocks (BrokenBarrierError) unless all three judges are in flight together
+                barrier.wait()
+                return {"opinions": [{
+                    "judge": judge,
+                    "criterion_id": "test_criterion",
+                    "score": 3,
+                    "argument": f"{judge} opinion",
+                    "cited_evidence": [],
+                }]}
+            return node
+
+        sample_state.update({"repo_url": "", "pdf_path": None, "pdf_display": None,
+                             "rubric_path": None, "synthesis_rules": {"security_override": "Test"}})
+        with patch('src.graph.prosecutor_node', fake_judge("Prosecutor")), \
+                patch('src.graph.defense_node', fake_judge("Defense")), \
+                patch('src.graph.tech_lead_node', fake_judge("TechLead")):
+            graph = build_auditor_graph()
+            final_state = graph.invoke(sample_state)
+
+        assert len(final_state["opinions"]) == 3
+        assert final_state["final_report"] is not None
+        assert final_state["final_report"].criteria[0].final_score == 3
@@ -1,6 +1,8 @@
 """Unit tests for node functions."""
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.state import AgentState, Evidence, JudicialOpinion
 from src.nodes.detectives import (
@@ -154,7 +156,7 @@ class TestJudgeNodes:
         """Test prosecutor node."""
         # Mock rate limiter
         mock_limiter = Mock()
-        mock_limiter.wait_if_needed.return_value = 0.0
+        mock_limiter.async_wait_if_needed = AsyncMock(return_value=0.0)
         mock_rate_limiter.return_value = mock_limiter
         
         # Mock LLM
@@ -166,18 +168,93 @@ class TestJudgeNodes:
             score=2,
             argument="Critical analysis"
         )
-        mock_chain.invoke.return_value = mock_opinion
+        mock_chain.ainvoke = AsyncMock(return_value=mock_opinion)
         mock_llm.with_structured_output.return_value = mock_chain
         mock_llm_class.return_value = mock_llm
         
-        with patch('src.nodes.judges.ChatPromptTemplate') as mock_prompt:
-            mock_pipe_left = Mock()
-            mock_pipe_left.__or__ = lambda self, other: other
-            mock_prompt.from_messages.return_value = mock_pipe_left
+        result = prosecutor_node(sample_state_with_evidence)
+        assert "opinions" in result
+        assert len(result["opinions"]) > 0
+        assert result["opinions"][0]["score"] == 2
+
+    @patch('src.nodes.judges.ChatOpenAI')
+    @patch('src.nodes.judges.get_rate_limiter')
+    def test_judges_skip_llm_without_evidence(self, mock_rate_limiter, mock_llm_class, sample_state_with_evidence, monkeypatch):
+        """Criteria with no evidence get a canned score-1 opinion without an LLM (or API key)."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        mock_rate_limiter.return_value.async_wait_if_needed = AsyncMock(return_value=0.0)
+        sample_state_with_evidence["evidences"] = {}
+
+        for node, judge in ((prosecutor_node, "Prosecutor"), (defense_node, "Defense"), (tech_lead_node, "TechLead")):
+            result = node(sample_state_with_evidence)
+            assert len(result["opinions"]) == 1
+            assert result["opinions"][0]["judge"] == judge
+            assert result["opinions"][0]["score"] == 1
+        mock_llm_class.assert_not_called()
+
+    def test_invoke_judicial_chain_uses_opinion_cache(self, tmp_path):
+        """A cached opinion for the same key skips the chain entirely."""
+        from src.nodes.judges import _ainvoke_judicial_chain
+        from src.utils.opinion_cache import OpinionCache
+
+        cache = OpinionCache(tmp_path / "opinions.sqlite3")
+        key = OpinionCache.make_key("TechLead", "gpt-4o", 0.3, "system", "user")
+        mock_chain = Mock()
+        mock_chain.ainvoke = AsyncMock(return_value=JudicialOpinion(
+            judge="TechLead", criterion_id="test_criterion", score=3, argument="Works with caveats"
+        ))
+        with patch('src.nodes.judges.get_opinion_cache', return_value=cache):
+            first = asyncio.run(_ainvoke_judicial_chain(mock_chain, [], "TechLead", "test_criterion", key))
+            second = asyncio.run(_ainvoke_judicial_chain(mock_chain, [], "TechLead", "test_criterion", key))
+        assert first == second
+        assert mock_chain.ainvoke.call_count == 1
+
+    def test_opinion_cache_evicts_least_recently_used(self, tmp_path):
+        """Puts beyond max_entries drop the entry read or written longest ago."""
+        import itertools
+        from src.utils.opinion_cache import OpinionCache
+
+        cache = OpinionCache(tmp_path / "opinions.sqlite3", max_entries=2)
+        opinion = JudicialOpinion(judge="Defense", criterion_id="test_criterion", score=4, argument="Solid")
+        with patch('src.utils.opinion_cache.time.time', side_effect=itertools.count()):
+            cache.put("a", opinion)
+            cache.put("b", opinion)
+            assert cache.get("a") == opinion
+            cache.put("c", opinion)
+        assert cache.get("b") is None
+        assert cache.get("a") == opinion
+        assert cache.get("c") == opinion
+
+    def test_cancelled_slot_wait_does_not_leak_slot(self):
+        """A waiter cancelled while its thread blocks in acquire() gives the slot back."""
+        import threading
+        from src.nodes.judges import _judge_slot
+
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+
+        async def wait_then_cancel():
+            async def hold():
+                async with _judge_slot():
+                    pass
+            task = asyncio.create_task(hold())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch('src.nodes.judges._get_judge_slots', return_value=slots):
+            asyncio.run(wait_then_cancel())
+        slots.release()
+        assert slots.acquire(timeout=2)
 
-            result = prosecutor_node(sample_state_with_evidence)
-            assert "opinions" in result
-            assert len(result["opinions"]) > 0
+    def test_judge_concurrency_tolerates_bad_values(self, monkeypatch):
+        """An empty or non-numeric JUDGE_CONCURRENCY falls back to the default; values clamp to >= 1."""
+        from src.config import JUDGE_MAX_CONCURRENCY, _judge_concurrency
+
+        for raw, expected in (("", JUDGE_MAX_CONCURRENCY), ("many", JUDGE_MAX_CONCURRENCY), ("0", 1), (" 4 ", 4)):
+            monkeypatch.setenv("JUDGE_CONCURRENCY", raw)
+            assert _judge_concurrency() == expected
 
 
 class TestJusticeNode:
@@ -227,18 +304,57 @@ class TestJusticeNode:
             "final_report": None
         }
     
-    @patch('src.nodes.justice.load_rubric')
-    def test_chief_justice_node(self, mock_load_rubric, sample_state_with_opinions):
+    def test_chief_justice_node(self, sample_state_with_opinions):
         """Test Chief Justice synthesis node."""
-        mock_load_rubric.return_value = {
-            "synthesis_rules": {
-                "security_override": "Test",
-                "fact_supremacy": "Test"
-            }
-        }
-        
         result = chief_justice_node(sample_state_with_opinions)
         assert "final_report" in result
         assert result["final_report"] is not None
         assert hasattr(result["final_report"], "overall_score")
         assert hasattr(result["final_report"], "criteria")
+
+    def test_chief_justice_missing_judge_scores_one(self, sample_state_with_opinions):
+        """A criterion without all three judges is scored 1 and keeps the opinions it has."""
+        sample_state_with_opinions["rubric_dimensions"].append({
+            "id": "other_criterion",
+            "name": "Other Criterion",
+            "target_artifact": "github_repo",
+            "forensic_instruction": "Test",
+        })
+        sample_state_with_opinions["synthesis_rules"] = {"security_override": "Test"}
+        sample_state_with_opinions["opinions"] += [
+            JudicialOpinion(judge="Prosecutor", criterion_id="other_criterion", score=2, argument="Weak"),
+            JudicialOpinion(judge="Defense", criterion_id="other_criterion", score=3, argument="Fine"),
+            JudicialOpinion(judge="Defense", criterion_id="other_criterion", score=5, argument="Great"),
+        ]
+
+        report = chief_justice_node(sample_state_with_opinions)["final_report"]
+        by_id = {cr.dimension_id: cr for cr in report.criteria}
+        assert by_id["test_criterion"].final_score == 3
+        other = by_id["other_criterion"]
+        assert other.final_score == 1
+        assert [o.judge for o in other.judge_opinions] == ["Prosecutor", "Defense"]
+        assert other.judge_opinions[1].score == 3
+
+    def test_dissent_summary_reports_three_judge_variance(self, sample_state_with_opinions):
+        """The dissent quotes the same max-min spread as the variance resolution."""
+        sample_state_with_opinions["opinions"] = [
+            JudicialOpinion(judge="Prosecutor", criterion_id="test_criterion", score=1, argument="Broken"),
+            JudicialOpinion(judge="Defense", criterion_id="test_criterion", score=4, argument="Good"),
+            JudicialOpinion(judge="TechLead", criterion_id="test_criterion", score=5, argument="Solid"),
+        ]
+
+        dissent = chief_justice_node(sample_state_with_opinions)["final_report"].criteria[0].dissent_summary
+        assert "4 point variance" in dissent
+        assert "High variance (4 points)" in dissent
+
+    def test_security_override_matches_explicit_findings_case_insensitively(self):
+        """Only concrete security-finding language triggers the security cap."""
+        from src.nodes.justice import _security_override_condition
+
+        def prosecutor(argument):
+            return JudicialOpinion(judge="Prosecutor", criterion_id="c", score=1, argument=argument)
+
+        assert _security_override_condition(prosecutor("Shell Injection via subprocess"), None, None, "c")
+        assert _security_override_condition(prosecutor("OS.SYSTEM call detected in tools"), None, None, "c")
+        assert not _security_override_condition(prosecutor("Mentions os.system only"), None, None, "c")
+        assert not _security_override_condition(prosecutor("Security looks reasonable"), None, None, "c")
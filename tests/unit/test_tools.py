@@ -4,7 +4,7 @@ import tempfile
 import pytest
 from pathlib import Path
 
-from src.tools.git_tools import clone_repo, analyze_git_history
+from src.tools.git_tools import clone_repo, analyze_git_history, is_valid_repo_url
 from src.tools.ast_parser import (
     verify_state_models,
     analyze_graph_structure,
@@ -30,6 +30,44 @@ class TestGitTools:
         assert result["has_progression"] is False
         assert "commit_count" in result
 
+    def test_analyze_git_history_line_separator_in_subject(self, tmp_path):
+        """A subject containing U+2028 is one commit, not a parse failure."""
+        import shutil
+        import subprocess
+
+        if shutil.which("git") is None:
+            pytest.skip("git not installed")
+        env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t",
+               "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True, env=env)
+        for subject in ("add state", "add graph\u2028and nodes", "add judges", "add report"):
+            subprocess.run(["git", "-C", str(tmp_path), "commit", "-q", "--allow-empty", "-m", subject],
+                           check=True, env=env)
+        result = analyze_git_history(str(tmp_path))
+        assert result["commit_count"] == 4
+        assert result["has_progression"] is True
+
+    def test_is_valid_repo_url(self):
+        """Only http(s)/git@ URLs without whitespace or shell metacharacters pass."""
+        assert is_valid_repo_url(" https://github.com/test/repo.git\n")
+        assert is_valid_repo_url("git@github.com:test/repo.git")
+        assert not is_valid_repo_url("https://github.com/test/repo;rm -rf /")
+        assert not is_valid_repo_url("https://github.com/test/repo|cat")
+        assert not is_valid_repo_url("https://github.com/test/my repo")
+        assert not is_valid_repo_url("file:///etc/passwd")
+
+    def test_clone_repo_shallow_options(self, tmp_path):
+        """depth/blobless are passed to git clone ahead of the URL and target."""
+        from unittest.mock import patch
+
+        with patch("src.tools.git_tools.subprocess.run") as mock_run, \
+                patch("src.tools.git_tools._is_git_repo", return_value=True):
+            repo_path = clone_repo("https://github.com/test/repo.git", str(tmp_path), depth=1, blobless=True)
+        assert mock_run.call_args[0][0] == [
+            "git", "clone", "--depth", "1", "--no-tags", "--filter=blob:none",
+            "https://github.com/test/repo.git", repo_path,
+        ]
+
 
 class TestASTParser:
     """Tests for AST parser tools."""
@@ -52,6 +90,13 @@ class TestASTParser:
         assert result["is_safe"] is False
         assert "uses_sandboxing" in result
     
+    def test_verify_safe_tool_engineering_tools_path_is_file(self, tmp_path):
+        """An unlistable src/tools is reported as not safe instead of raising."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "tools").write_text("not a directory")
+        result = verify_safe_tool_engineering(str(tmp_path))
+        assert result["is_safe"] is False
+
     def test_verify_structured_output_nonexistent_path(self):
         """Test structured output verification on non-existent path."""
         result = verify_structured_output("/nonexistent/path")
@@ -78,6 +123,49 @@ class Evidence(BaseModel):
         # Should find the Pydantic model
         assert "has_pydantic_state" in result
 
+    def test_verifier_memo_invalidates_on_edit(self, tmp_path):
+        """Memoized verifier results are reused until an inspected file changes."""
+        judges = tmp_path / "src" / "nodes" / "judges.py"
+        judges.parent.mkdir(parents=True)
+        judges.write_text("llm = None\n")
+        first = verify_structured_output(str(tmp_path))
+        assert first["has_structured_output"] is False
+        assert verify_structured_output(str(tmp_path)) == first
+
+        judges.write_text("chain = llm.with_structured_output(JudicialOpinion)\n")
+        assert verify_structured_output(str(tmp_path))["has_structured_output"] is True
+
+    def test_ast_cache_reuses_tree_until_file_changes(self, tmp_path):
+        """An unchanged file is served from memory; an edited one is re-parsed."""
+        from src.utils.ast_cache import ASTCache
+
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        cache = ASTCache()
+        first = cache.get_ast(str(source))
+        assert cache.get_ast(str(source)) is first
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+        source.write_text("y = 2\n")
+        tree = cache.get_ast(str(source))
+        assert cache.stats["misses"] == 2
+        assert tree.body[0].targets[0].id == "y"
+
+    def test_ast_cache_returns_source_with_tree(self, tmp_path):
+        """Source text (universal newlines) and tree come back from one call."""
+        from src.utils.ast_cache import ASTCache
+
+        source = tmp_path / "module.py"
+        source.write_bytes(b"x = 1\r\ny = 2\r\n")
+        content, tree = ASTCache().get_source_and_tree(str(source))
+        assert content == "x = 1\ny = 2\n"
+        assert len(tree.body) == 2
+
+        source.write_text("def broken(:\n")
+        content, tree = ASTCache().get_source_and_tree(str(source))
+        assert content == "def broken(:\n"
+        assert tree is None
+
 
 class TestPDFParser:
     """Tests for PDF parser tools."""
@@ -107,3 +195,40 @@ class TestPDFParser:
         """Test PDF parsing on non-existent file."""
         with pytest.raises(FileNotFoundError):
             parse_pdf("/nonexistent/file.pdf")
+
+    def test_parse_pdf_caches_text_by_content(self, tmp_path):
+        """A second parse of identical bytes reads the cached text instead of extracting."""
+        from unittest.mock import patch
+
+        pdf = tmp_path / "report.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        with patch("src.tools.pdf_parser.PDF_TEXT_CACHE_DIR", tmp_path / "cache"), \
+                patch("src.tools.pdf_parser._primary_pdf_backend", return_value="pypdf"), \
+                patch("src.tools.pdf_parser._extract_pdf_text",
+                      return_value=("Extracted text", "pypdf", True)) as mock_extract:
+            assert parse_pdf(str(pdf)) == "Extracted text"
+            assert parse_pdf(str(pdf)) == "Extracted text"
+            assert mock_extract.call_count == 1
+
+            parse_pdf(str(pdf), use_cache=False)
+            assert mock_extract.call_count == 2
+
+    def test_parse_pdf_does_not_serve_degraded_text(self, tmp_path):
+        """Text with failed pages, or from a fallback extractor, is not served from the cache."""
+        from unittest.mock import patch
+
+        pdf = tmp_path / "report.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        with patch("src.tools.pdf_parser.PDF_TEXT_CACHE_DIR", tmp_path / "cache"), \
+                patch("src.tools.pdf_parser._primary_pdf_backend", return_value="docling"), \
+                patch("src.tools.pdf_parser._extract_pdf_text") as mock_extract:
+            mock_extract.return_value = ("[Page 1: Extraction failed]", "pypdf", False)
+            parse_pdf(str(pdf))
+            assert not (tmp_path / "cache").exists()
+
+            # Docling failed at runtime and pypdf produced the text: cached under pypdf only
+            mock_extract.return_value = ("Fallback text", "pypdf", True)
+            parse_pdf(str(pdf))
+            assert parse_pdf(str(pdf)) == "Fallback text"
+            assert mock_extract.call_count == 3
+            assert [p.name.split("-")[1] for p in (tmp_path / "cache").glob("*.md")] == ["pypdf"]